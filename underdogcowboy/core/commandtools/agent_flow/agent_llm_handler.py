@@ -326,8 +326,6 @@ def run_category_call(llm_config, session_name, agent_name, agent_type, pre_prom
 
 def run_category_description_change(llm_config, agent_name, agent_type, category_to_change, session_name):
     from underdogcowboy import AgentDialogManager
-    import json
-    import os
 
     config = load_config()
     base_dir = config['storage']['base_dir']
@@ -425,8 +423,6 @@ def run_category_description_change(llm_config, agent_name, agent_type, category
 
 def run_category_title_change(llm_config, agent_name, agent_type, category_to_change, session_name):
     from underdogcowboy import AgentDialogManager
-    import json
-    import os
 
     config = load_config()
     base_dir = config['storage']['base_dir']
@@ -539,8 +535,6 @@ def run_scale_call(llm_config, agent_name, agent_type, category_to_change, sessi
         dict or str: Updated assessment_structure with scales or an error message.
     """
     from underdogcowboy import AgentDialogManager
-    import json
-    import os
 
     config = load_config()
     base_dir = config['storage']['base_dir']
@@ -660,9 +654,6 @@ def run_scale_call(llm_config, agent_name, agent_type, category_to_change, sessi
 
 def run_leftoff_summary(llm_config, agent_type, aggregate_files_path, session_name):
     
-    import json
-    import os
-
     from underdogcowboy import AgentDialogManager
     from underdogcowboy.core.tools.work_session_tools import aggregate_files 
     
@@ -17,7 +17,7 @@ class ClipBoardCopy(MessageEmitterMixin):
     @on(LLMResultReceived)
     async def handle_llm_result_received(self, event: LLMResultReceived):
         self.latest_result = event.result
-        await asyncio.get_event_loop().run_in_executor(None, self.copy_to_clipboard, self.latest_result)
+        await asyncio.get_running_loop().run_in_executor(None, self.copy_to_clipboard, self.latest_result)
     
     @on(CopyToClipboard)
     async def handle_copy_to_clipboard(self, event: CopyToClipboard):
@@ -1,36 +1,63 @@
 
 import asyncio
+import inspect
 from typing import Any, Callable, Optional
 import logging
 
-
-from concurrent.futures import ThreadPoolExecutor
-
 from events.message_mixin import MessageEmitterMixin
 from events.llm_events import LLMCallComplete, LLMCallError
 
 from exceptions import MessagePostTargetNotSetError
 
+# Calls a single manager runs at once, and calls it holds before submitters have to wait
+MAX_CONCURRENT_CALLS = 5
+MAX_QUEUED_CALLS = 64
+
 class LLMCallManager(MessageEmitterMixin):
-    """Manages asynchronous LLM (Large Language Model) calls with a task queue and thread pool executor."""
+    """Manages asynchronous LLM (Large Language Model) calls with a task queue.
 
-    def __init__(self, max_workers=5):
-        super().__init__()  
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        self._task_queue = asyncio.Queue()
-        asyncio.create_task(self._process_queue())
+    Calls run on the event loop's default executor, which MultiScreenApp shares across the whole app.
+    """
 
-    async def _process_queue(self):
+    def __init__(self, max_workers=MAX_CONCURRENT_CALLS):
+        super().__init__()  
+        self._task_queue = asyncio.Queue(maxsize=MAX_QUEUED_CALLS)
+        self._max_workers = max_workers
+        self._workers = []  # Started on first submit, when the event loop is guaranteed to be running
+
+    def start(self):
+        """Start the queue workers if they are not running yet."""
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self._max_workers)]
+
+    def stop(self):
+        """Cancel the queue workers and drop queued calls; call from the owning widget's on_unmount."""
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+        # Queued calls target the unmounted widget, so a later start() must not run them
+        while not self._task_queue.empty():
+            self._task_queue.get_nowait()
+            self._task_queue.task_done()
+
+    async def _worker(self):
+        """Take queued calls one at a time; a full queue makes submitters wait."""
         while True:
             task = await self._task_queue.get()
-            asyncio.create_task(self._handle_task(*task))
-            self._task_queue.task_done()        
+            try:
+                await self._handle_task(*task)
+            finally:
+                self._task_queue.task_done()
 
     async def _handle_task(self, llm_function, *args):
         logging.info('Handling Task')
         input_id = args[-1]  # Assume input_id is always the last argument
         try:
-            result = await asyncio.to_thread(llm_function, *args[:-1])
+            if inspect.iscoroutinefunction(llm_function):
+                # Async LLM functions run on the loop directly; no worker thread needed
+                result = await llm_function(*args[:-1])
+            else:
+                result = await asyncio.to_thread(llm_function, *args[:-1])
             # Check if result is a tuple and unpack
             if isinstance(result, tuple):
                 response, adm = result
@@ -38,9 +65,9 @@ class LLMCallManager(MessageEmitterMixin):
                 response = result
                 adm = None
             self.post_message(LLMCallComplete(sender=self, input_id=input_id, result=response, adm=adm))
-            logging.info(f"Used post_message to send LLMCallComplete with input_id {input_id}")
+            logging.info("Used post_message to send LLMCallComplete with input_id %s", input_id)
         except Exception as e:
-            logging.debug(f"_handle_task reports error: {e}")
+            logging.debug("_handle_task reports error: %s", e)
             self.post_message(LLMCallError(sender=self, input_id=input_id, error=str(e)))
 
         logging.debug("_handle Task post (after) send self.post_message")
@@ -48,9 +75,10 @@ class LLMCallManager(MessageEmitterMixin):
 
     async def submit_llm_call_with_agent_and_id(self, llm_function, llm_config, agent_name, agent_type, id, input_id, pre_prompt,post_prompt):
         """Submits an LLM call to the task queue."""
-        logging.info(f"Submitting LLM call for input_id: {input_id}: agent: {agent_name} type: {agent_type}")
+        logging.info("Submitting LLM call for input_id: %s: agent: %s type: %s", input_id, agent_name, agent_type)
         if not self._message_post_target:
             raise MessagePostTargetNotSetError("Message post target not set.")
+        self.start()
         
         # Put the task in the async queue for processing
         await self._task_queue.put((
@@ -64,15 +92,16 @@ class LLMCallManager(MessageEmitterMixin):
             input_id  # Ensure input_id is the last argument
         ))
 
-        logging.info(f"LLM call for input_id {input_id} has been queued")
+        logging.info("LLM call for input_id %s has been queued", input_id)
 
     async def submit_llm_call_with_agent_with_id_and_sesssion(self, llm_function, llm_config, 
                                                                 agent_name, agent_type, category_to_change,
                                                                 session_name, input_id):
         """Submits an LLM call to the task queue."""
-        logging.info(f"Submitting LLM call for input_id: {input_id}: agent: {agent_name} type: {agent_type}")
+        logging.info("Submitting LLM call for input_id: %s: agent: %s type: %s", input_id, agent_name, agent_type)
         if not self._message_post_target:
             raise MessagePostTargetNotSetError("Message post target not set.")
+        self.start()
         
         # Put the task in the async queue for processing
         await self._task_queue.put((
@@ -85,14 +114,15 @@ class LLMCallManager(MessageEmitterMixin):
             input_id  # Ensure input_id is the last argument
         ))
 
-        logging.info(f"LLM call for input_id {input_id} has been queued")
+        logging.info("LLM call for input_id %s has been queued", input_id)
 
 
     async def submit_llm_call_with_agent(self, llm_function, llm_config, session_name, agent_name, agent_type, input_id, pre_prompt,post_prompt):
         """Submits an LLM call to the task queue."""
-        logging.info(f"Submitting LLM call for input_id: {input_id}: agent: {agent_name} type: {agent_type}")
+        logging.info("Submitting LLM call for input_id: %s: agent: %s type: %s", input_id, agent_name, agent_type)
         if not self._message_post_target:
             raise MessagePostTargetNotSetError("Message post target not set.")
+        self.start()
         
         # Put the task in the async queue for processing
         await self._task_queue.put((
@@ -106,14 +136,15 @@ class LLMCallManager(MessageEmitterMixin):
             input_id  # Ensure input_id is the last argument
         ))
 
-        logging.info(f"LLM call for input_id {input_id} has been queued")
+        logging.info("LLM call for input_id %s has been queued", input_id)
 
 
     async def submit_llm_call(self, llm_function, llm_config, processor, input_id, message_text):
         """Submits an LLM call to the task queue."""
-        logging.info(f"Submitting LLM call for input_id: {input_id}")
+        logging.info("Submitting LLM call for input_id: %s", input_id)
         if not self._message_post_target:
             raise MessagePostTargetNotSetError("Message post target not set.")
+        self.start()
         
         # Put the task in the async queue for processing
         await self._task_queue.put((
@@ -123,13 +154,14 @@ class LLMCallManager(MessageEmitterMixin):
             message_text,
             input_id  # Ensure input_id is last
         ))
-        logging.info(f"LLM call for input_id {input_id} has been queued")
+        logging.info("LLM call for input_id %s has been queued", input_id)
 
     async def submit_analysis_call(self, llm_function, llm_config, agent_name, input_id, pre_prompt=None, post_prompt=None, adm=None):
         """Submits an analysis LLM call to the task queue using the provided analysis_function."""
-        logging.info(f"Submitting analysis call for input_id: {input_id}")
+        logging.info("Submitting analysis call for input_id: %s", input_id)
         if not self._message_post_target:
             raise MessagePostTargetNotSetError("Message post target not set.")
+        self.start()
 
         # Put the task in the async queue for processing
         await self._task_queue.put((
@@ -142,4 +174,4 @@ class LLMCallManager(MessageEmitterMixin):
             input_id  # Ensure input_id is the last argument
         ))
 
-        logging.info(f"Analysis call for input_id {input_id} has been queued")
+        logging.info("Analysis call for input_id %s has been queued", input_id)
@@ -1,6 +1,5 @@
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
 from events.message_mixin import MessageEmitterMixin
 from events.llm_events import LLMCallComplete, LLMCallError
 from collections import namedtuple
@@ -16,11 +15,10 @@ class MessagePostTargetNotSetError(Exception):
 
 
 class LLMCallManager(MessageEmitterMixin):
-    """Manages asynchronous LLM calls with a task queue and thread pool executor."""
+    """Manages asynchronous LLM calls with a task queue, running them on the loop's default executor."""
 
-    def __init__(self, max_workers=5):
+    def __init__(self):
         super().__init__()
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self._task_queue = asyncio.Queue()
         self._shutdown = False
         try:
@@ -38,12 +36,10 @@ class LLMCallManager(MessageEmitterMixin):
             self._task_queue.task_done()
 
     async def _handle_task(self, task):
-        loop = asyncio.get_running_loop()
         input_id = task.input_id
         logging.debug(f"Handling task for input_id: {input_id} with args: {task.args}")
         try:
-            result = await loop.run_in_executor(
-                self.executor,
+            result = await asyncio.to_thread(
                 task.llm_function,
                 *task.args  # Pass all other args to llm_function
             )
@@ -100,5 +96,4 @@ class LLMCallManager(MessageEmitterMixin):
         self._shutdown = True
         await self._task_queue.put(None)
         await self._task_queue.join()
-        self.executor.shutdown(wait=True)
         logging.info("LLMCallManager has been shut down.")
\ No newline at end of file
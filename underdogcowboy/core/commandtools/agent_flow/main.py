@@ -1,9 +1,16 @@
+import asyncio
+import atexit
 import logging
+import queue
 import yaml
 import json
 import sys
 import os
 
+from logging.handlers import QueueHandler, QueueListener
+
+from concurrent.futures import ThreadPoolExecutor
+
 # quick fix. The work, make relative imports with the "from .[folder] etc"
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -12,8 +19,8 @@ from typing import Dict, Set, Union
 
 from textual import on
 from textual.app import App
+from textual.css.query import NoMatches
 from textual.events import Event
-from textual.reactive import Reactive
 from textual.binding import Binding
 from dotenv import load_dotenv
 
@@ -153,6 +160,14 @@ def generate_on_mount(screen_name, dynamic_container_component=None, dynamic_con
     def on_mount(self):
         logging.info(f"{screen_name} on_mount called")
 
+        # Let screens that keep references to their widgets look them up once, now that they exist
+        cache_widgets = getattr(self, "_cache_widgets", None)
+        if cache_widgets:
+            try:
+                cache_widgets()
+            except NoMatches as e:
+                logging.warning(f"{screen_name}: widgets not found on mount ({e}); they are looked up on demand")
+
         # Update state info and header
         state_info = self.query_one("#state-info", StateInfo)
         state_info.update_state_info(self.state_machine, "")
@@ -193,9 +208,6 @@ class MultiScreenApp(App):
     # Key bindings for user interactions to switch between screens or sync sessions
     BINDINGS = []
     
-    # Reactive property to track if session synchronization is active
-    # sync_active: Reactive[bool] = Reactive(False)
-    
     # Shared SessionManager that can be used across screens when syncing is active
     shared_session_manager: SessionManager = None
 
@@ -228,11 +240,12 @@ class MultiScreenApp(App):
 
         self.clarity_processor = None
 
-        self.sync_active: Reactive[bool] = Reactive(False)
-        # Ensure no unintended triggers:
-        if self.sync_active:
-            return
-        self.sync_active = True
+        # Worker threads shared by every LLM call in the app; installed as the loop's default executor on mount
+        self.executor: ThreadPoolExecutor = None
+
+        # Plain flag: nothing watches it, so it needs no reactive descriptor. Starts enabled,
+        # as before (the Reactive object previously stored here was always truthy).
+        self.sync_active: bool = True
 
     def install_screen(self, factory, name: str) -> None:
         """Register a screen factory in screen_map."""
@@ -255,6 +268,11 @@ class MultiScreenApp(App):
     def on_mount(self) -> None:
         """Mount screens when the app starts, dynamically from configuration."""
 
+        # One thread pool for the whole app, so LLMCallManager instances don't each spin up their own
+        max_workers = self.config.get('executor', {}).get('max_workers', 5)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-call")
+        asyncio.get_running_loop().set_default_executor(self.executor)
+
         self._initialize_bindings_from_config()
 
         # Load and merge configurations
@@ -306,6 +324,8 @@ class MultiScreenApp(App):
                 screen_type=config.get("screen_type", None)
             )
             setattr(screen_class, "compose", compose_method)
+            # The screen looks its container up by the same configured id
+            setattr(screen_class, "dynamic_container_id", dynamic_container_id)
 
             # Generate and attach the on_mount method
             on_mount_method = generate_on_mount(
@@ -331,6 +351,12 @@ class MultiScreenApp(App):
         else:
             logging.warning("No initial_screen defined in configuration.")
 
+    def on_unmount(self) -> None:
+        """Release the shared thread pool without waiting on calls still in flight."""
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
     def _initialize_bindings_from_config(self) -> None:
         """Initialize bindings from configuration at startup."""
         current_dir = os.path.dirname(__file__)
@@ -474,13 +500,28 @@ def setup_logging(config):
     for handler in logging.root.handlers[:]:
         logging.root.removeHandler(handler)
 
-    logging.basicConfig(
-        filename=log_filepath,
-        level=config['logging']['level'],
-        format=config['logging']['format']
-    )
+    # Write the log file from a listener thread, so logging calls on the event loop only enqueue
+    file_handler = logging.FileHandler(log_filepath)
+    file_handler.setFormatter(logging.Formatter(config['logging']['format']))
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logging.root.addHandler(QueueHandler(log_queue))
+    logging.root.setLevel(config['logging']['level'])
     print(f"Logging initialized. Log file: {log_filepath}")
 
+def install_event_loop_policy():
+    """Run the app on uvloop when it is installed, otherwise keep the default asyncio loop."""
+    try:
+        import uvloop
+    except ImportError:
+        logging.info("uvloop not installed, using the default asyncio event loop")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logging.info("Using uvloop event loop policy")
+
 def load_config(config_path: str) -> dict:
     with open(config_path, 'r') as file:
         return yaml.safe_load(file)
@@ -499,6 +540,8 @@ def main():
           
 
 
+    install_event_loop_policy()
+
     print("Starting the app...")
     app = MultiScreenApp(config_path=config_path)
     app.run()
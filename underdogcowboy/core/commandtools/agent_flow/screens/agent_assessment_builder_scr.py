@@ -1,7 +1,15 @@
+import asyncio
 import logging
 import os
 import json
 
+from functools import cached_property
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Vertical, Horizontal
@@ -35,20 +43,46 @@ from screens.session_screen import SessionScreen
 from state_machines.agent_assessment_state_machine import create_agent_assessment_state_machine
 
 
+def _write_export(export_path: str, data_to_export: dict) -> None:
+    """Write the exported assessment structure to export_path as JSON."""
+    # Checked on every export, so a folder deleted while the app runs is created again
+    export_dir = os.path.dirname(export_path)
+    if export_dir:
+        os.makedirs(export_dir, exist_ok=True)
+    if orjson is not None:
+        with open(export_path, 'wb') as f:
+            f.write(orjson.dumps(data_to_export, option=orjson.OPT_INDENT_2))
+    else:
+        # Same layout as the orjson path: two-space indent, UTF-8 text rather than \u escapes
+        with open(export_path, 'w', encoding='utf-8') as f:
+            json.dump(data_to_export, f, indent=2, ensure_ascii=False)
+
+
 class AgentAssessmentBuilderScreen(SessionScreen):
     """A screen for the agent assessment builder."""
     # CSS_PATH = "../state_machine_app.css"
 
+    # Id of the dynamic container; MultiScreenApp sets it from the screen's JSON config
+    dynamic_container_id = "center-dynamic-container-agent-assessment-builder"
+
     def __init__(self, name: str = "agent_assessment_builder", state_machine: StateMachine = None, session_manager: SessionManager = None, *args, **kwargs):
         # super().__init__(*args, **kwargs)
         super().__init__(name=name, state_machine=state_machine, session_manager=session_manager, *args, **kwargs)
         self.title = "Agent Assessment Builder"
         self.state_machine = state_machine or create_agent_assessment_state_machine()
+        # States this screen switches to directly
+        self._initial_state = self.state_machine.states.get("initial")
+        self._analysis_ready_state = self.state_machine.states.get("analysis_ready")
         self.session_manager = session_manager
         self.ui_factory = UIFactory(self)
         self.screen_name = "AgentAssessmentBuilderScreen"
         self._pending_session_manager = None
 
+        # Widgets looked up once in on_mount
+        self._dynamic_container = None
+        self._state_info = None
+        self._button_grid = None
+
         self.is_current_screen = False
 
         self.update_ui_retry_count = 0
@@ -74,9 +108,10 @@ class AgentAssessmentBuilderScreen(SessionScreen):
 
     def on_mount(self) -> None:
         """Called when the screen is mounted. It sets up the state and updates the UI based on session data."""
+        # MultiScreenApp replaces this with main.generate_on_mount(), which also calls _cache_widgets()
         logging.info("AgentAssessmentBuilderScreen on_mount called")
-        state_info = self.query_one("#state-info", StateInfo)
-        state_info.update_state_info(self.state_machine, "")
+        self._cache_widgets()
+        self._state_info.update_state_info(self.state_machine, "")
         self.update_header()
 
         if self._pending_session_manager:
@@ -92,11 +127,25 @@ class AgentAssessmentBuilderScreen(SessionScreen):
         else:
             self._pending_session_manager = new_session_manager
 
+    def on_unmount(self) -> None:
+        self._dynamic_container = None
+        self._state_info = None
+        self._button_grid = None
+
+    def _cache_widgets(self) -> None:
+        """Look up the widgets this screen updates on every state change. Raises NoMatches until they are mounted."""
+        if self._dynamic_container is None:
+            self._dynamic_container = self.query_one(f"#{self.dynamic_container_id}", DynamicContainer)
+            self._state_info = self.query_one("#state-info", StateInfo)
+            self._button_grid = self.query_one(StateButtonGrid)
+
     def get_dynamic_container(self):
-        try:
-            return self.query_one("#center-dynamic-container-agent-assessment-builder", DynamicContainer)
-        except NoMatches:
-            return None
+        if self._dynamic_container is None:
+            try:
+                self._cache_widgets()
+            except NoMatches:
+                return None
+        return self._dynamic_container
 
 
     def update_ui_after_session_load(self):
@@ -112,10 +161,10 @@ class AgentAssessmentBuilderScreen(SessionScreen):
             if stored_state and stored_state in self.state_machine.states:
                 self.state_machine.current_state = self.state_machine.states[stored_state]
             else:
-                self.state_machine.current_state = self.state_machine.states["initial"]
+                self.state_machine.current_state = self._initial_state
 
-            self.query_one(StateInfo).update_state_info(self.state_machine, "")
-            self.query_one(StateButtonGrid).update_buttons()
+            self._state_info.update_state_info(self.state_machine, "")
+            self._button_grid.update_buttons()
             self.update_header()
         except NoMatches:
             if self.update_ui_retry_count < self.max_update_ui_retries:
@@ -202,62 +251,64 @@ class AgentAssessmentBuilderScreen(SessionScreen):
 
     def transition_to_initial_state(self):
         """Transition the state machine to the initial state and update the session."""
-        initial_state = self.state_machine.states.get("initial")
+        initial_state = self._initial_state
         if initial_state:
+            self._cache_widgets()
             self.state_machine.current_state = initial_state
             logging.info(f"Set state to initial")
-            self.query_one(StateInfo).update_state_info(self.state_machine, "")
-            self.query_one(StateButtonGrid).update_buttons()
+            self._state_info.update_state_info(self.state_machine, "")
+            self._button_grid.update_buttons()
 
             self.session_manager.update_data("current_state", "initial", screen_name=self.screen_name)
         else:
             logging.error(f"Failed to set state to initial: State not found")
 
+    @cached_property
+    def _message_export_path(self) -> str:
+        """Configured message export folder, read from the general config on first use."""
+        return LLMConfigManager().get_general_config().get('message_export_path', '')
+
     def clear_session(self):
         self.session_manager.current_session_data = None
         self.session_manager.current_session_name = None
         self.update_header()
         
 
-    def on_action_selected(self, event: ActionSelected) -> None:
+    async def on_action_selected(self, event: ActionSelected) -> None:
         action = event.action
+        self._cache_widgets()
 
         if action == "reset":
-            self.state_machine.current_state = self.state_machine.states["initial"]
-            self.app.query_one(StateInfo).update_state_info(self.state_machine, "")
-            self.app.query_one(StateButtonGrid).update_buttons()
+            self.state_machine.current_state = self._initial_state
+            self._state_info.update_state_info(self.state_machine, "")
+            self._button_grid.update_buttons()
 
         if action == 'export':
            
-            config_manager = LLMConfigManager() 
-            message_export_path = config_manager.get_general_config().get('message_export_path', '')
+            message_export_path = self._message_export_path
         
             # data from session analysis related
             agents_data = self.session_manager.get_data("agents", screen_name=self.screen_name)
             categories = agents_data[self.agent_name_plain]["categories"]                
 
         
-            # Make json file for each data value
+            # Make json file for each data value; the file I/O runs off the event loop
             try:
-                os.makedirs(message_export_path, exist_ok=True)
-
                 data_to_export = {
                     "categories": categories,  # Nest the array under the "categories" key
                 }
                 
                 filename = f"assessment_categories_for_{self.agent_name_plain}.json"
                 export_path = os.path.join(message_export_path, filename)
-                with open(export_path, 'w') as f:
-                    json.dump(data_to_export, f, indent=4)  # Convert nested data to JSON format
+                await asyncio.to_thread(_write_export, export_path, data_to_export)
 
             except Exception as e:
                 print(f"Error during file creation: {str(e)}")
                 self.app.notify("Export Error")
+            else:
+                self.app.notify(f"Assessment structure exported to your message export folder: {message_export_path} ")
 
-
-            self.app.notify(f"Assessment structure exported to your message export folder: {message_export_path} ")
-
-        dynamic_container = self.query_one("#center-dynamic-container-agent-assessment-builder", DynamicContainer)
+        dynamic_container = self._dynamic_container
         dynamic_container.clear_content()
 
         # Mapping actions to their respective UI classes
@@ -289,12 +340,13 @@ class AgentAssessmentBuilderScreen(SessionScreen):
         
         self.notify(f"Loaded Agent: {agent_name_str}")
 
-        dynamic_container = self.query_one("#center-dynamic-container-agent-assessment-builder", DynamicContainer)
+        self._cache_widgets()
+        dynamic_container = self._dynamic_container
         dynamic_container.clear_content()
         
-        self.state_machine.current_state = self.state_machine.states["analysis_ready"]
-        self.app.query_one(StateInfo).update_state_info(self.state_machine, "")
-        self.app.query_one(StateButtonGrid).update_buttons()
+        self.state_machine.current_state = self._analysis_ready_state
+        self._state_info.update_state_info(self.state_machine, "")
+        self._button_grid.update_buttons()
 
 
         self.update_header()
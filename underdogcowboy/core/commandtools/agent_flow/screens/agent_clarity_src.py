@@ -1,20 +1,18 @@
-from typing import Dict, List, Set
+from typing import Dict, Tuple
 import os
 import logging
+import importlib
+
+from functools import cache
 
 from textual import on
-from textual.app import ComposeResult
-from textual.containers import Vertical, Horizontal
-from textual.widgets import  (  Label, Header, Footer, Collapsible )
 from textual.css.query import NoMatches
+from textual.events import Mount
 
 from uccli import StateMachine  
 from underdogcowboy.core.config_manager import LLMConfigManager 
 
 """ imports clarity sytem """
-# utils
-from agent_llm_handler import send_agent_data_to_llm
-
 # Storage
 from session_manager import SessionManager
 
@@ -24,21 +22,12 @@ from llm_manager import LLMManager
 # UI
 from ui_components.session_dependent import SessionDependentUI
 from ui_factory import UIFactory
-from ui_components.system_message_ui import SystemMessageUI
 from ui_components.dynamic_container import DynamicContainer
-from ui_components.analyze_ui_candidate import AnalyzeUI # integration test
-# from ui_components.analyze_ui import AnalyzeUI # integration test
 from ui_components.chat_ui import ChatUI
 
-from ui_components.feedback_input_ui import FeedbackInputUI
-from ui_components.feedback_output_ui import FeedbackOutputUI
-from ui_components.feedback_rules_ui import FeedbackRulesUI
-from ui_components.feedback_constraints_ui import FeedbackConstraintsUI
-from ui_components.load_agent_ui import LoadAgentUI
 from ui_components.state_button_grid_ui import StateButtonGrid 
 from ui_components.state_info_ui import StateInfo
 from ui_components.center_content_ui import CenterContent
-from ui_components.left_side_ui import LeftSideContainer
 
 # Events
 from events.button_events import UIButtonPressed
@@ -54,10 +43,30 @@ from state_machines.clarity_state_machine import create_clarity_state_machine
 
 
 
+@cache
+def _load_ui(module_name: str, class_name: str) -> type:
+    """Import a panel's module on first use and return its UI class."""
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 class ClarityScreen(SessionScreen):
 
     # CSS_PATH = "../state_machine_app_candidate_missing.css"
 
+    # Id of the dynamic container; MultiScreenApp sets it from the screen's JSON config
+    dynamic_container_id = "center-dynamic-container-clarity"
+
+    # Mapping actions to the module and name of their UI classes, imported when first opened
+    _ACTION_UI: Dict[str, Tuple[str, str]] = {
+        "analyze": ("ui_components.analyze_ui_candidate", "AnalyzeUI"),  # integration test; was ui_components.analyze_ui
+        "feedback_input": ("ui_components.feedback_input_ui", "FeedbackInputUI"),
+        "feedback_output": ("ui_components.feedback_output_ui", "FeedbackOutputUI"),
+        "feedback_rules": ("ui_components.feedback_rules_ui", "FeedbackRulesUI"),
+        "feedback_constraints": ("ui_components.feedback_constraints_ui", "FeedbackConstraintsUI"),
+        "system_message": ("ui_components.system_message_ui", "SystemMessageUI"),
+        "load_agent": ("ui_components.load_agent_ui", "LoadAgentUI")
+    }
+
     def __init__(self, 
                  name: str = "clarity_screen",
                  state_machine: StateMachine = None, 
@@ -66,8 +75,11 @@ class ClarityScreen(SessionScreen):
         super().__init__(name=name, state_machine=state_machine, session_manager=session_manager, *args, **kwargs)
         
         self.state_machine = state_machine or create_clarity_state_machine()
+        self._states = self.state_machine.states
         self.session_manager = session_manager  
         self.ui_factory = UIFactory(self)
+        # Resolved (ui_class, action) per button id; the factory result only depends on the id
+        self._ui_factory_cache: Dict[str, tuple] = {}
         
         self.current_agent = None
         self.is_current_screen = False
@@ -82,14 +94,29 @@ class ClarityScreen(SessionScreen):
             default_model_name='Claude 3.5 Sonnet (Upgrade)' 
         )
         
-        # Set the default LLM during initialization
-        self.llm_manager.set_default_llm()
+        # The default LLM is selected on first use, not while the screen is being built
+        self._default_llm_set = False
             
         # Define the screen name for namespacing
         self.screen_name = "ClarityScreen"
 
         self._pending_session_manager = None
 
+        # Widgets looked up once per mount
+        self._dynamic_container = None
+        self._state_info = None
+        self._button_grid = None
+
+        # Action whose panel was last mounted in the dynamic container, and that panel
+        self._current_action_ui = None
+        self._current_action_panel = None
+
+        # Set once a stored session has been seen
+        self._sessions_exist = False
+
+        # Set when a session load arrives before the dynamic container is mounted
+        self._pending_ui_update = False
+
         self.update_ui_retry_count = 0
         self.max_update_ui_retries = 5
 
@@ -97,7 +124,7 @@ class ClarityScreen(SessionScreen):
         self.max_on_agent_selected_retries = 5  # Adjust as needed
 
 
-        logging.info(f"CSS path set to: {self.CSS_PATH}. Able to read CSS as textual.")
+        logging.info("CSS path set to: %s. Able to read CSS as textual.", self.CSS_PATH)
 
 
     def configure_default_llm(self):
@@ -107,14 +134,26 @@ class ClarityScreen(SessionScreen):
         except ValueError as e:
             self.notify(str(e), severity="error")
 
+    def _ensure_default_llm(self):
+        """Select the default LLM the first time this screen's LLM config is needed."""
+        if self._default_llm_set:
+            return
+        try:
+            self.llm_manager.set_default_llm()
+            self._default_llm_set = True
+        except ValueError as e:
+            self.notify(str(e), severity="error")
+
     def get_current_llm_config(self):
         """Fetch the current LLM config from LLMManager."""
+        self._ensure_default_llm()
         return self.llm_manager.get_current_llm_config()
 
     def on_mount(self) -> None:
         logging.info("ClarityScreen on_mount called")
-        state_info = self.query_one("#state-info", StateInfo)
-        state_info.update_state_info(self.state_machine, "")
+        # In the app this is replaced by main.generate_on_mount(), which calls _cache_widgets() too
+        self._cache_widgets()
+        self._state_info.update_state_info(self.state_machine, "")
         self.update_header()
 
         # Apply pending session manager after widgets are ready
@@ -123,6 +162,36 @@ class ClarityScreen(SessionScreen):
             self._pending_session_manager = None
             self.call_later(self.set_session_manager, session_manager)
 
+    def on_unmount(self) -> None:
+        self._invalidate_widget_cache()
+
+    def _invalidate_widget_cache(self) -> None:
+        """Drop cached widget references so a remount queries fresh ones."""
+        self._dynamic_container = None
+        self._state_info = None
+        self._button_grid = None
+        self._current_action_ui = None
+        self._current_action_panel = None
+
+    def _cache_widgets(self) -> None:
+        """Store the clarity container, StateInfo and button grid on first use; NoMatches propagates before compose has run."""
+        if self._dynamic_container is None:
+            self._dynamic_container = self.query_one(f"#{self.dynamic_container_id}", DynamicContainer)
+            self._state_info = self.query_one("#state-info", StateInfo)
+            self._button_grid = self.query_one("#button-grid", StateButtonGrid)
+
+    def _has_sessions(self) -> bool:
+        """Whether any stored session exists. Sessions are never deleted from the UI, so a yes is remembered."""
+        if not self._sessions_exist:
+            self._sessions_exist = bool(self.session_manager.list_sessions())
+        return self._sessions_exist
+
+    def _clear_content(self) -> None:
+        """Empty the dynamic container and forget which action panel it showed."""
+        self._dynamic_container.clear_content()
+        self._current_action_ui = None
+        self._current_action_panel = None
+
     def set_session_manager(self, new_session_manager: SessionManager):
         self.session_manager = new_session_manager
         if self.is_mounted:
@@ -141,26 +210,43 @@ class ClarityScreen(SessionScreen):
 
     def update_ui_after_session_load(self):
         try:
-            dynamic_container = self.query_one("#center-dynamic-container-clarity", DynamicContainer)
-            dynamic_container.clear_content()
+            self._cache_widgets()
+            self._clear_content()
 
             stored_state = self.session_manager.get_data("current_state", screen_name=self.screen_name)
-            if stored_state and stored_state in self.state_machine.states:
-                self.state_machine.current_state = self.state_machine.states[stored_state]
-            else:
-                self.state_machine.current_state = self.state_machine.states["initial"]
+            target_state = self._states.get(stored_state) if stored_state else None
+            if target_state is None:
+                target_state = self._states["initial"]
 
-            self.query_one(StateInfo).update_state_info(self.state_machine, "")
-            self.query_one(StateButtonGrid).update_buttons()
+            # The cleared panel was the current action, so the state info is always reset.
+            # The button grid depends only on the state; rebuild it only when that changes
+            if target_state is not self.state_machine.current_state:
+                self.state_machine.current_state = target_state
+                self._button_grid.update_buttons()
+            self._state_info.update_state_info(self.state_machine, "")
 
             self.update_header()
+            self.update_ui_retry_count = 0
         except NoMatches:
-            if self.update_ui_retry_count < self.max_update_ui_retries:
-                logging.warning("Dynamic container not found; scheduling UI update later.")
-                self.update_ui_retry_count += 1
-                self.call_later(self.update_ui_after_session_load)
+            if self.is_mounted:
+                # Already mounted, so no Mount will follow; try again once the pending refresh is done
+                if self.update_ui_retry_count < self.max_update_ui_retries:
+                    logging.warning("Dynamic container not found; retrying UI update after refresh.")
+                    self.update_ui_retry_count += 1
+                    self.call_after_refresh(self.update_ui_after_session_load)
+                else:
+                    logging.error("Dynamic container not found after multiple attempts. Aborting UI update.")
+                    self.update_ui_retry_count = 0
             else:
-                logging.error("Dynamic container not found after multiple attempts. Aborting UI update.")
+                logging.warning("Dynamic container not found; deferring UI update until mount.")
+                self._pending_ui_update = True
+
+    @on(Mount)
+    def _run_pending_ui_update(self) -> None:
+        # Registered with @on because the app replaces on_mount on configured screens
+        if self._pending_ui_update:
+            self._pending_ui_update = False
+            self.update_ui_after_session_load()
 
     def on_agent_selected(self, event: AgentSelected):
         try:
@@ -169,16 +255,16 @@ class ClarityScreen(SessionScreen):
             self.agent_name_plain = agent_name_str
             self.notify(f"Loaded Agent: {agent_name_str}")
 
-            dynamic_container = self.query_one("#center-dynamic-container-clarity", DynamicContainer)
-            dynamic_container.clear_content()
+            self._cache_widgets()
+            self._clear_content()
             
             # Update header with current agent and session (if available)
             self.update_header()
             
             # Transition of the state machine 
-            self.state_machine.current_state = self.state_machine.states["agent_loaded"]
-            self.query_one(StateInfo).update_state_info(self.state_machine, "")
-            self.query_one(StateButtonGrid).update_buttons()
+            self.state_machine.current_state = self._states["agent_loaded"]
+            self._state_info.update_state_info(self.state_machine, "")
+            self._button_grid.update_buttons()
             
             # Store the current agent in the session data
             self.session_manager.update_data("current_agent", self.current_agent, screen_name=self.screen_name)
@@ -217,31 +303,28 @@ class ClarityScreen(SessionScreen):
         # Store the current agent in the session data
         self.session_manager.update_data("current_agent", self.current_agent, screen_name=self.screen_name)
 
+    def _transition_to(self, state_name: str) -> bool:
+        """Switch to state_name, refresh the task panel and store the state in the session."""
+        state = self._states.get(state_name)
+        if not state:
+            logging.error("Failed to set state to %s: State not found", state_name)
+            return False
+        self._cache_widgets()
+        self.state_machine.current_state = state
+        logging.info("Set state to %s", state_name)
+        self._state_info.update_state_info(self.state_machine, "")
+        self._button_grid.update_buttons()
+        # Store the current state in the session (per-screen data). Re-entering the stored
+        # state would only add a history entry and save the whole session file again.
+        if self.session_manager.get_data("current_state", screen_name=self.screen_name) != state_name:
+            self.session_manager.update_data("current_state", state_name, screen_name=self.screen_name)
+        return True
+
     def transition_to_agent_loaded(self) -> None:
-        agent_loaded_state = self.state_machine.states.get("agent_loaded")
-        if agent_loaded_state:
-            self.state_machine.current_state = agent_loaded_state
-            logging.info(f"Set state to agent_loaded")
-            self.query_one(StateInfo).update_state_info(self.state_machine, "")
-            self.query_one(StateButtonGrid).update_buttons()
-            # Store the current state in the session (per-screen data)
-            self.session_manager.update_data("current_state", "agent_loaded", screen_name=self.screen_name)
-        else:
-            logging.error(f"Failed to set state to agent_loaded: State not found")
+        self._transition_to("agent_loaded")
 
     def transition_to_analyse_state(self) -> None:
-        analyse_state = self.state_machine.states.get("analysis_ready")
-        if analyse_state:
-            self.state_machine.current_state = analyse_state
-            logging.info(f"Set state to analysis_ready")
-            self.query_one(StateInfo).update_state_info(self.state_machine, "")
-            self.query_one(StateButtonGrid).update_buttons()
-            
-            # Store the current state in the session (per-screen data)
-            self.session_manager.update_data("current_state", "analysis_ready", screen_name=self.screen_name)
-
-        else:
-            logging.error(f"Failed to set state to analysis_ready: State not found")
+        self._transition_to("analysis_ready")
 
     def transition_to_analysis_ready(self) -> None:
         logging.info("Entering transition_to_analysis_ready method")
@@ -251,28 +334,14 @@ class ClarityScreen(SessionScreen):
             self.notify("No active session. Please create or load a session first.", severity="error")
             return
 
-        # logging.info(f"Current session data: {self.session_manager.current_session_data}")
-
-        analysis_ready_state = self.state_machine.states.get("analysis_ready")
-        if analysis_ready_state:
-            self.state_machine.current_state = analysis_ready_state
-            logging.info(f"Set state to analysis_ready")
-            self.query_one(StateInfo).update_state_info(self.state_machine, "")
-            self.query_one(StateButtonGrid).update_buttons()
-            
-            try:
-                # Store the current state in the session (per-screen data)
-                logging.info(f"Attempting to update session data. Screen name: {self.screen_name}")
-                self.session_manager.update_data("current_state", "analysis_ready", screen_name=self.screen_name)
-                logging.info("Successfully updated session data with new state")
-            except Exception as e:
-                logging.error(f"Failed to update session data: {str(e)}")
-                logging.error(f"Exception type: {type(e)}")
-                logging.error(f"Exception args: {e.args}")
-                self.notify(f"Error updating session data: {str(e)}", severity="error")
-        else:
-            logging.error(f"Failed to set state to analysis_ready: State not found")
-            self.notify("Failed to transition to analysis ready state", severity="error")
+        try:
+            if not self._transition_to("analysis_ready"):
+                self.notify("Failed to transition to analysis ready state", severity="error")
+        except Exception as e:
+            logging.error("Failed to update session data: %s", e)
+            logging.error("Exception type: %s", type(e))
+            logging.error("Exception args: %s", e.args)
+            self.notify(f"Error updating session data: {str(e)}", severity="error")
 
         logging.info("Exiting transition_to_analysis_ready method")
 
@@ -280,52 +349,58 @@ class ClarityScreen(SessionScreen):
     def handle_analysis_complete(self, event: AnalysisCompleteEvent):
         adm = event.adm
         # Load the ChatUI with the adm
-        dynamic_container = self.query_one("#center-dynamic-container-clarity", DynamicContainer)
-        dynamic_container.clear_content()
+        self._cache_widgets()
+        dynamic_container = self._dynamic_container
+        self._clear_content()
         chat_ui = ChatUI(name="analysis_chat", type="analysis", processor=adm)
         dynamic_container.load_content(chat_ui)
         logging.info("ChatUI loaded with AgentDialogManager after analysis.")
 
     @on(UIButtonPressed)
     def handle_ui_button_pressed(self, event: UIButtonPressed) -> None:
-        logging.debug(f"Handler 'handle_ui_button_pressed' invoked with button_id: {event.button_id}")
-        dynamic_container = self.query_one("#center-dynamic-container-clarity", DynamicContainer)
-        dynamic_container.clear_content()
-
-        try:
-            # Use the UI factory to get the corresponding UI and action
-            ui_class, action = self.ui_factory.ui_factory(event.button_id)
+        logging.debug("Handler 'handle_ui_button_pressed' invoked with button_id: %s", event.button_id)
+        self._cache_widgets()
+        dynamic_container = self._dynamic_container
+        self._clear_content()
 
-            # Load the UI component if it exists (for "load-session")
-            if ui_class:
-                if event.button_id == "load-session" and not self.session_manager.list_sessions():
-                    self.notify("No sessions available. Create a new session first.", severity="warning")
+        entry = self._ui_factory_cache.get(event.button_id)
+        if entry is None:
+            try:
+                entry = self.ui_factory.ui_factory(event.button_id)
+            except ValueError as e:
+                logging.error("Error: %s", e)
+                return
+            self._ui_factory_cache[event.button_id] = entry
+        ui_class, action = entry
+
+        # Load the UI component if it exists (for "load-session")
+        if ui_class:
+            if event.button_id == "load-session" and not self._has_sessions():
+                self.notify("No sessions available. Create a new session first.", severity="warning")
+            else:
+                # Check if ui_class is a subclass of SessionDependentUI
+                if issubclass(ui_class, SessionDependentUI):
+                    ui_instance = ui_class(session_manager=self.session_manager, 
+                                        screen_name=self.screen_name,
+                                        agent_name_plain=self.agent_name_plain)
                 else:
-                    # Check if ui_class is a subclass of SessionDependentUI
-                    if issubclass(ui_class, SessionDependentUI):
-                        ui_instance = ui_class(session_manager=self.session_manager, 
-                                            screen_name=self.screen_name,
-                                            agent_name_plain=self.agent_name_plain)
-                    else:
-                        ui_instance = ui_class()
+                    ui_instance = ui_class()
 
-                    dynamic_container.load_content(ui_instance)
+                dynamic_container.load_content(ui_instance)
 
-            # Handle the action (state change) only if there's an action function
-            if action:
-                action()
-
-        except ValueError as e:
-            logging.error(f"Error: {e}")
+        # Handle the action (state change) only if there's an action function
+        if action:
+            action()
 
     def on_action_selected(self, event: ActionSelected) -> None:
         action = event.action
+        self._cache_widgets()
 
         if action == "reset":
             # self.clear_session()
-            self.state_machine.current_state = self.state_machine.states["initial"]
-            self.app.query_one(StateInfo).update_state_info(self.state_machine, "")
-            self.app.query_one(StateButtonGrid).update_buttons()
+            self.state_machine.current_state = self._states["initial"]
+            self._state_info.update_state_info(self.state_machine, "")
+            self._button_grid.update_buttons()
 
         if action == 'export_analysis':
            
@@ -366,42 +441,43 @@ class ClarityScreen(SessionScreen):
             self.app.notify(f"Export(s) in your message export folder: {message_export_path} ")
 
 
-        dynamic_container = self.query_one("#center-dynamic-container-clarity", DynamicContainer)
-        dynamic_container.clear_content()
+        # Keep this action's panel instead of rebuilding it, as long as nothing else has cleared it
+        # (SystemMessageUI empties the container itself on submit)
+        if action == self._current_action_ui and self._current_action_panel in self._dynamic_container.children:
+            return
 
-        # Mapping actions to their respective UI classes
-        ui_class = {
-            "analyze": AnalyzeUI,
-            "feedback_input": FeedbackInputUI,
-            "feedback_output": FeedbackOutputUI,
-            "feedback_rules": FeedbackRulesUI,
-            "feedback_constraints": FeedbackConstraintsUI,
-            "system_message": SystemMessageUI,
-            "load_agent": LoadAgentUI
-        }.get(action)
+        dynamic_container = self._dynamic_container
+        self._clear_content()
 
-        if ui_class:
+        ui_spec = self._ACTION_UI.get(action)
+
+        if ui_spec:
+            ui_class = _load_ui(*ui_spec)
             # Instantiate with parameters if it's a subclass of SessionDependentUI
             if issubclass(ui_class, SessionDependentUI):
-                if  ui_class == AnalyzeUI:
-                    dynamic_container.mount(ui_class(
+                if action == "analyze":
+                    panel = ui_class(
                         session_manager=self.session_manager,
                         state_machine = self.state_machine,
                         screen_name=self.screen_name,
                         agent_name_plain=self.agent_name_plain
-                    ))                    
+                    )
                 else:
-                    dynamic_container.mount(ui_class(
+                    panel = ui_class(
                         session_manager=self.session_manager,
                         screen_name=self.screen_name,
                         agent_name_plain=self.agent_name_plain
-                    ))
+                    )
                     
             else:
-                dynamic_container.mount(ui_class())
+                panel = ui_class()
         else:
             # For other actions, load generic content as before
-            dynamic_container.mount(CenterContent(action))
+            panel = CenterContent(action)
+
+        dynamic_container.mount(panel)
+        self._current_action_ui = action
+        self._current_action_panel = panel
 
 
 
@@ -234,30 +234,32 @@ class SessionManager(MessageEmitterMixin):
             return self.current_session_data.shared_data.data.get(key)
 
     def update_data(self, key: str, value: Any, screen_name: str = None) -> None:
-        logging.info(f"Entering update_data method. Key: {key}, Value: {value}, Screen name: {screen_name}")
+        logging.info("Entering update_data method. Key: %s, Value: %s, Screen name: %s", key, value, screen_name)
         
         if not self.current_session_data:
             logging.error("No current session loaded. Cannot update data.")
             raise SessionNotLoadedError("No active session loaded. Cannot update data.")
         
-        logging.info(f"Current session data: {self.current_session_data}")
+        # The full session repr is large; only build it when debug output is actually wanted
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Current session data: %s", self.current_session_data)
         
         try:
             if screen_name:
-                logging.info(f"Updating screen-specific data for screen: {screen_name}")
+                logging.info("Updating screen-specific data for screen: %s", screen_name)
                 if screen_name not in self.current_session_data.screens:
-                    logging.info(f"Creating new ScreenData for screen: {screen_name}")
+                    logging.info("Creating new ScreenData for screen: %s", screen_name)
                     self.current_session_data.screens[screen_name] = ScreenData()
                 # agent on here aswell i think right?    
                 self.current_session_data.screens[screen_name].data[key] = value
-                logging.info(f"Updated screen-specific data.")
+                logging.info("Updated screen-specific data.")
                 # Log command
                 command_desc = f"update_data: {key}"
                 self.add_command_result(command_desc, {"value": value}, screen_name=screen_name)
             else:
                 logging.info("Updating shared data")
                 self.current_session_data.shared_data.data[key] = value
-                logging.info(f"Updated shared data. New value:")
+                logging.info("Updated shared data.")
                 # Log command
                 command_desc = f"update_data: {key}"
                 self.add_command_result(command_desc, {"value": value})
@@ -265,12 +267,12 @@ class SessionManager(MessageEmitterMixin):
             self.save_current_session()
             logging.info("Session saved after updating data")
         except KeyError as e:
-            logging.error(f"Screen '{screen_name}' does not exist in session data.")
+            logging.error("Screen '%s' does not exist in session data.", screen_name)
             raise ScreenDataError(f"Screen '{screen_name}' does not exist.") from e
         except Exception as e:
-            logging.error(f"Error updating data: {str(e)}")
-            logging.error(f"Exception type: {type(e)}")
-            logging.error(f"Exception args: {e.args}")
+            logging.error("Error updating data: %s", e)
+            logging.error("Exception type: %s", type(e))
+            logging.error("Exception args: %s", e.args)
             raise StorageOperationError("Failed to update data in the session.") from e
 
         logging.info("Exiting update_data method")
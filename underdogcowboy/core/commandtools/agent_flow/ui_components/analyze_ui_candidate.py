@@ -44,6 +44,9 @@ class AnalyzeUI(SessionDependentUI):
 
         logging.info(f"post target message set to: {self.llm_call_manager._message_post_target}")
 
+    def on_unmount(self) -> None:
+        self.llm_call_manager.stop()
+
     def compose(self) -> ComposeResult:
         yield Static("Analysis Result:", id="result-label", classes="hidden")
         yield Static(id="analysis-result", classes="hidden")
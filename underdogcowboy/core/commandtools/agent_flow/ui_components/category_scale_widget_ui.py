@@ -1,7 +1,14 @@
+import os
 import logging
 import asyncio
+import atexit
+import inspect
+import queue
 
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List
+from logging.handlers import QueueHandler, QueueListener
 
 from textual import on
 from textual.app import App, ComposeResult
@@ -9,30 +16,92 @@ from textual.containers import Vertical, Horizontal
 from textual.widgets import Label,Header, Select, Input, Static, TextArea, Button
 from textual.message import Message
 
-# Configure the logging to log to a file only
-logging.basicConfig(
-    filename='category_scale_widget.log',
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+def _configure_logging():
+    """Configure the logging to log to a file only, attaching the handler once.
+
+    Records are put on a queue and written by a listener thread, so the event
+    loop never blocks on file I/O. If the root logger already has handlers (the
+    host app configured logging, or this module was loaded a second time) no
+    new file handler is opened, matching what ``logging.basicConfig`` does.
+
+    Only warnings and errors are recorded unless ``UDC_DEBUG`` is set in the
+    environment.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    log_queue = queue.Queue(-1)
+    file_handler = logging.FileHandler('category_scale_widget.log')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.DEBUG if os.environ.get("UDC_DEBUG") else logging.WARNING)
+
+_configure_logging()
+
+# Seconds of typing inactivity before a description edit is written back
+DESCRIPTION_COMMIT_DELAY = 0.15
+
+# Seconds to wait for further refresh requests before issuing one combined LLM call
+REFRESH_COALESCE_WINDOW = 0.05
+
+# Leading option of the category Select, shared by every rebuild of the list
+_REFRESH_ALL_OPT = ("refresh_all", "Refresh All")
+
+# Options shown before any categories have been retrieved
+_INITIAL_OPTIONS = (("create_initial", "Create Initial Categories"),)
+
+# Explicit __slots__ rather than slots=True, which needs Python 3.10; slotted fields cannot have defaults,
+# so from_dict fills them in
+@dataclass
+class Scale:
+    """A single scale belonging to a category."""
+    __slots__ = ("name", "description")
+    name: str
+    description: str
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(name=data["name"], description=data.get("description", ""))
+
+@dataclass
+class Category:
+    """A category with its description and scales."""
+    __slots__ = ("name", "description", "scale")
+    name: str
+    description: str
+    scale: List[Scale]
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            name=data["name"],
+            description=data.get("description", ""),
+            scale=[Scale.from_dict(s) for s in data.get("scale", [])],
+        )
 
 class LLMCallManager:
-    """Manages asynchronous calls using a ThreadPoolExecutor."""
-    def __init__(self, max_workers=5):
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        logging.debug("LLMCallManager initialized with ThreadPoolExecutor")
+    """Manages asynchronous calls on the event loop's default executor."""
+    __slots__ = ()
+
+    def __init__(self):
+        logging.debug("LLMCallManager initialized")
 
     async def run_llm_call(self, llm_function, *args):
-        """Run a function asynchronously in a thread pool."""
-        logging.debug(f"Running function {llm_function.__name__} with args: {args}")
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self.executor, llm_function, *args)
+        """Await a coroutine function directly; run a blocking function in the default thread pool."""
+        logging.debug("Running function %s with args: %s", llm_function.__name__, args)
+        if inspect.iscoroutinefunction(llm_function):
+            return await llm_function(*args)
+        return await asyncio.to_thread(llm_function, *args)
 
-    def simulate_category_retrieval(self):
+    async def simulate_category_retrieval(self):
         """Simulate a long-running category retrieval (mock for LLM call)."""
-        import time
         logging.debug("Simulating category retrieval...")
-        time.sleep(2)  # Simulate network delay
+        await asyncio.sleep(2)  # Simulate network delay
         return [
             {
                 "name": "Category 1",
@@ -49,11 +118,10 @@ class LLMCallManager:
             },
         ]
 
-    def simulate_new_categories(self):
+    async def simulate_new_categories(self):
         """Simulate the retrieval of new categories for Refresh All."""
-        import time
         logging.debug("Simulating new categories for refresh...")
-        time.sleep(2)  # Simulate network delay
+        await asyncio.sleep(2)  # Simulate network delay
         return [
             {
                 "name": "Category 3",
@@ -70,11 +138,10 @@ class LLMCallManager:
             },
         ]
 
-    def simulate_scale_retrieval(self, category_name):
+    async def simulate_scale_retrieval(self, category_name):
         """Simulate a long-running scale retrieval for a category (mock for LLM call)."""
-        import time
-        logging.debug(f"Simulating scale retrieval for category '{category_name}'...")
-        time.sleep(2)  # Simulate network delay
+        logging.debug("Simulating scale retrieval for category '%s'...", category_name)
+        await asyncio.sleep(2)  # Simulate network delay
         # Return some mock scales for the category
         return [
             {"name": f"{category_name} Scale 1", "description": f"This is the description for {category_name} Scale 1."},
@@ -94,9 +161,11 @@ class SelectCategoryWidget(Static):
         super().__init__()
         self.selected_category = None  # Initialize to track the selected category
         self.llm_call_manager = llm_call_manager         
+        self._pending_refresh = set()  # Fields ("title"/"description") waiting for the next LLM call
+        self._refresh_task = None
 
         self.select = Select(
-            options=[("create_initial", "Create Initial Categories")],
+            options=_INITIAL_OPTIONS,
             id="category-select"
         )
         self.loading_indicator = Static(
@@ -124,13 +193,19 @@ class SelectCategoryWidget(Static):
             "Refresh Both", 
             id="refresh-both-button"
         )
+        # Button id -> handler, so a click is a single dict lookup
+        self._button_handlers = {
+            "refresh-title-button": self.refresh_title,
+            "refresh-description-button": self.refresh_description,
+            "refresh-both-button": self.refresh_both,
+        }
         
         self.lbl_text =  Label("Modify Directly or use buttons for agent assistance", id="lbl_text") 
 
         # Initially hide certain components, including buttons
         self.loading_indicator.visible = False
-        self.input_box.visible = False
-        self.description_area.visible = False
+        self.input_box.display = False
+        self.description_area.display = False
         self.refresh_title_button.visible = False
         self.refresh_description_button.visible = False
         self.refresh_both_button.visible = False
@@ -152,40 +227,55 @@ class SelectCategoryWidget(Static):
 
     async def refresh_title(self):
         """Function to refresh the title using LLMCallManager."""
-        if self.selected_category:  # Ensure there's a category selected
-            # Call the LLM to retrieve new title data (mockup method)
-            title_data = await self.llm_call_manager.run_llm_call(
-                self.llm_call_manager.simulate_scale_retrieval, self.selected_category
-            )
-            # Update the input box with the new title data (simulated)
-            self.input_box.value = title_data[0]['name']  # Assuming the first element holds the title info
-            self.input_box.refresh()
+        self._request_refresh("title")
     
     async def refresh_description(self):
         """Function to refresh the description using LLMCallManager."""
-        if self.selected_category:
-            # Call the LLM to retrieve new description data (mockup method)
-            description_data = await self.llm_call_manager.run_llm_call(
-                self.llm_call_manager.simulate_scale_retrieval, self.selected_category
-            )
-            # Update the description area with the new description
-            self.description_area.value = description_data[0]['description']
-            self.description_area.refresh()
+        self._request_refresh("description")
     
     async def refresh_both(self):
         """Function to refresh both title and description."""
-        await self.refresh_title()
-        await self.refresh_description()
+        self._request_refresh("title", "description")
+
+    def _request_refresh(self, *fields):
+        """Queue field refreshes; requests arriving within the coalescing window share one LLM call."""
+        if not self.selected_category:  # Ensure there's a category selected
+            return
+        self._pending_refresh.update(fields)
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._dispatch_refresh())
+
+    async def _dispatch_refresh(self):
+        """Issue one LLM call per batch of pending field refreshes."""
+        try:
+            while self._pending_refresh:
+                await asyncio.sleep(REFRESH_COALESCE_WINDOW)
+                fields, self._pending_refresh = self._pending_refresh, set()
+                # Block further clicks until this call returns
+                self.set_refresh_buttons_disabled(True)
+                try:
+                    # Call the LLM to retrieve new title and description data (mockup method)
+                    data = await self.llm_call_manager.run_llm_call(
+                        self.llm_call_manager.simulate_scale_retrieval, self.selected_category
+                    )
+                except Exception as e:
+                    logging.error("Error refreshing %s: %s", ", ".join(sorted(fields)), e)
+                    continue
+                # Assuming the first element holds the title and description info.
+                # Both assignments repaint their widget, so no explicit refresh() is needed.
+                with self.app.batch_update():
+                    if "title" in fields:
+                        self.input_box.value = data[0]['name']
+                    if "description" in fields:
+                        self.description_area.text = data[0]['description']
+        finally:
+            self.set_refresh_buttons_disabled(False)
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events."""
-        button_id = event.button.id
-        if button_id == "refresh-title-button":
-            await self.refresh_title()  # Ensure this is awaited
-        elif button_id == "refresh-description-button":
-            await self.refresh_description()
-        elif button_id == "refresh-both-button":
-            await self.refresh_both()
+        handler = self._button_handlers.get(event.button.id)
+        if handler:
+            await handler()
 
     def show_buttons(self):
         """Utility method to make buttons visible."""
@@ -201,6 +291,12 @@ class SelectCategoryWidget(Static):
         self.refresh_both_button.visible = False
         self.lbl_text.visible = False
 
+    def set_refresh_buttons_disabled(self, disabled):
+        """Utility method to enable or disable the refresh buttons."""
+        self.refresh_title_button.disabled = disabled
+        self.refresh_description_button.disabled = disabled
+        self.refresh_both_button.disabled = disabled
+
 class SelectScaleWidget(Static):
     """Widget for the UI components of scales."""
     def __init__(self):
@@ -214,8 +310,8 @@ class SelectScaleWidget(Static):
         self.create_scales_button.visible = False
         self.scale_select.visible = False
         self.loading_indicator.visible = False
-        self.scale_input_box.visible = False
-        self.scale_description_area.visible = False
+        self.scale_input_box.display = False
+        self.scale_description_area.display = False
 
     def compose(self) -> ComposeResult:
         yield self.create_scales_button
@@ -226,22 +322,45 @@ class SelectScaleWidget(Static):
 
 class CategoryWidget(Static):
     """Widget for managing categories."""
-    def __init__(self, llm_call_manager, all_categories, id=None):
+    def __init__(self, llm_call_manager, all_categories, categories_by_name, id=None):
         super().__init__(id=id)
         self.selected_category = None
         self.llm_call_manager = llm_call_manager
         self.all_categories = all_categories  # Datastructure passed via init
+        self.categories_by_name = categories_by_name  # Name index over all_categories, shared with ScaleWidget
         self.selected_category = None
+        self._desc_timer = None
+        self._pending_desc = None  # (category, text_area) edit waiting for the debounce timer
+        self._options_list = []
+        self._option_index = {}
+        self._retrieve_task = None
         self.category_components = SelectCategoryWidget(self.llm_call_manager)
+        self._rebuild_index()
 
     def compose(self) -> ComposeResult:
         yield self.category_components
 
+    def on_unmount(self) -> None:
+        self._commit_description()
+
+    def _rebuild_index(self):
+        """Rebuild the shared name index in place after all_categories is (re)loaded."""
+        self.categories_by_name.clear()
+        self.categories_by_name.update((cat.name, cat) for cat in self.all_categories)
+
+    def _set_category_options(self):
+        """Build the Select options from all_categories and remember each name's position."""
+        self._options_list = [_REFRESH_ALL_OPT, *((cat.name, cat.name) for cat in self.all_categories)]
+        self._option_index = {value: i for i, (_, value) in enumerate(self._options_list)}
+        self.category_components.select.set_options(self._options_list)
+
     @on(Select.Changed, "#category-select")
     async def category_changed(self, event: Select.Changed) -> None:
         selected_value = event.value
-        logging.info(f"Category Select changed: {selected_value}")
+        logging.info("Category Select changed: %s", selected_value)
 
+        # Save an edit still waiting on the debounce before the text area shows another category
+        self._commit_description()
         self.selected_category = selected_value  
         # Ensure the category selection is propagated to SelectCategoryWidget
         self.category_components.selected_category = selected_value
@@ -252,79 +371,80 @@ class CategoryWidget(Static):
             self.category_components.hide_buttons()  # Hide buttons if no selection
             return
 
-        if selected_value == "Create Initial Categories":
-            self.category_components.select.set_options([("waiting", "Waiting for categories...")])
-            await self.show_loading_indicator()
-            self.category_components.hide_buttons()  # Hide buttons while loading
-            asyncio.create_task(self.retrieve_categories())
-
-        elif selected_value == "Refresh All":
-            self.category_components.select.set_options([("waiting", "Refreshing categories...")])
-            await self.show_loading_indicator()
-            self.category_components.hide_buttons()  # Hide buttons while refreshing
-            asyncio.create_task(self.retrieve_new_categories())
-
-        else:
-            self.selected_category = selected_value
-            self.category_components.input_box.value = selected_value
-            self.category_components.input_box.visible = True
+        # Apply all widget changes below in a single repaint
+        with self.app.batch_update():
+            if selected_value == "Create Initial Categories":
+                self.category_components.select.set_options([("waiting", "Waiting for categories...")])
+                await self.show_loading_indicator()
+                self.category_components.hide_buttons()  # Hide buttons while loading
+                self._start_retrieval(self.retrieve_categories(), "retrieve_categories")
 
-            selected_category_data = next(
-                (cat for cat in self.all_categories if cat['name'] == selected_value), None
-            )
-            if selected_category_data:
-                self.category_components.description_area.text = selected_category_data["description"]
-                self.category_components.description_area.visible = True
-                self.category_components.description_area.refresh()
+            elif selected_value == "Refresh All":
+                self.category_components.select.set_options([("waiting", "Refreshing categories...")])
+                await self.show_loading_indicator()
+                self.category_components.hide_buttons()  # Hide buttons while refreshing
+                self._start_retrieval(self.retrieve_new_categories(), "retrieve_new_categories")
 
-                self.category_components.show_buttons()  # Show buttons when a valid category is selected
-                self.post_message(CategorySelected(self, self.selected_category))
             else:
-                self.category_components.description_area.text = "Category not found."
-                self.category_components.description_area.visible = True
-                self.category_components.show_buttons()  # Optionally show buttons even if category not found
-
-        self.refresh()
+                self.selected_category = selected_value
+                self.category_components.input_box.value = selected_value
+                self.category_components.input_box.display = True
+
+                selected_category_data = self.categories_by_name.get(selected_value)
+                if selected_category_data:
+                    self.category_components.description_area.text = selected_category_data.description
+                    self.category_components.description_area.display = True
+
+                    self.category_components.show_buttons()  # Show buttons when a valid category is selected
+                    self.post_message(CategorySelected(self, self.selected_category))
+                else:
+                    self.category_components.description_area.text = "Category not found."
+                    self.category_components.description_area.display = True
+                    self.category_components.show_buttons()  # Optionally show buttons even if category not found
+
+    def _start_retrieval(self, coro, name):
+        """Run a retrieval as a named task, cancelling any retrieval still in flight."""
+        if self._retrieve_task and not self._retrieve_task.done():
+            self._retrieve_task.cancel()
+        self._retrieve_task = asyncio.create_task(coro, name=name)
 
     async def show_loading_indicator(self):
         self.category_components.loading_indicator.visible = True
-        self.refresh()
 
     async def hide_loading_indicator(self):
         self.category_components.loading_indicator.visible = False
-        self.refresh()
 
     async def retrieve_categories(self):
         try:
             categories = await self.llm_call_manager.run_llm_call(self.llm_call_manager.simulate_category_retrieval)
-            self.all_categories[:] = categories
-            self.category_components.select.set_options([("refresh_all", "Refresh All")] + [(cat['name'], cat['name']) for cat in categories])
-            self.category_components.select.value = categories[0]['name']
-            # After successfully retrieving categories, buttons can be shown
-            self.category_components.show_buttons()
         except Exception as e:
-            logging.error(f"Error retrieving categories: {e}")
-            self.category_components.select.set_options([("error", "Error loading categories")])
-            self.category_components.hide_buttons()  # Hide buttons on error
-        finally:
-            await self.hide_loading_indicator()
-            self.refresh()
+            logging.error("Error retrieving categories: %s", e)
+            categories = None
+        # A cancelled retrieval never gets here; the one replacing it owns the loading indicator
+        await self.apply_categories(categories, "Error loading categories")
 
     async def retrieve_new_categories(self):
         try:
             new_categories = await self.llm_call_manager.run_llm_call(self.llm_call_manager.simulate_new_categories)
-            self.all_categories[:] = new_categories
-            self.category_components.select.set_options([("refresh_all", "Refresh All")] + [(cat['name'], cat['name']) for cat in self.all_categories])
-            self.category_components.select.value = new_categories[0]['name']
-            # After successfully retrieving new categories, buttons can be shown
-            self.category_components.show_buttons()
         except Exception as e:
-            logging.error(f"Error retrieving new categories: {e}")
-            self.category_components.select.set_options([("error", "Error loading new categories")])
-            self.category_components.hide_buttons()  # Hide buttons on error
-        finally:
+            logging.error("Error retrieving new categories: %s", e)
+            new_categories = None
+        await self.apply_categories(new_categories, "Error loading new categories")
+
+    async def apply_categories(self, categories, error_label):
+        """Load retrieved categories into the widgets and hide the loading indicator in one repaint."""
+        with self.app.batch_update():
+            if categories:
+                self.all_categories[:] = [Category.from_dict(cat) for cat in categories]
+                self._rebuild_index()
+                self._set_category_options()
+                self.category_components.select.value = self.all_categories[0].name
+                # After successfully retrieving categories, buttons can be shown
+                self.category_components.show_buttons()
+            else:
+                self.category_components.select.set_options([("error", error_label)])
+                self.category_components.hide_buttons()  # Hide buttons on error
             await self.hide_loading_indicator()
-            self.refresh()
 
     @on(Input.Submitted, "#category-input")
     def category_input_submitted(self, event: Input.Submitted) -> None:
@@ -333,88 +453,125 @@ class CategoryWidget(Static):
             if not new_name:
                 logging.warning("Attempted to rename category to an empty string.")
                 return
+            if new_name == self.selected_category:
+                # Nothing renamed; just close the editor
+                self.category_components.input_box.display = False
+                self.category_components.description_area.display = False
+                return
 
-            logging.info(f"Renaming category '{self.selected_category}' to '{new_name}'")
-            for cat in self.all_categories:
-                if cat['name'] == self.selected_category:
-                    cat['name'] = new_name
-                    break
-
-            self.category_components.select.set_options([("refresh_all", "Refresh All")] + [(cat['name'], cat['name']) for cat in self.all_categories])
+            logging.info("Renaming category '%s' to '%s'", self.selected_category, new_name)
+            cat = self.categories_by_name.pop(self.selected_category, None)
+            if cat is not None:
+                cat.name = new_name
+                self.categories_by_name[new_name] = cat
+
+            # Only the renamed entry changes; patch it instead of rebuilding the list
+            index = self._option_index.pop(self.selected_category, None)
+            if index is not None:
+                self._options_list[index] = (new_name, new_name)
+                self._option_index[new_name] = index
+            self.category_components.select.set_options(self._options_list)
             self.category_components.select.value = new_name
 
             self.selected_category = new_name
-            self.category_components.input_box.visible = False
-            self.category_components.description_area.visible = False
-            self.refresh()
+            self.category_components.input_box.display = False
+            self.category_components.description_area.display = False
 
     @on(TextArea.Changed, "#category-description-area")
     def category_description_changed(self, event: TextArea.Changed) -> None:
         if self.selected_category:
-            new_description = event.text_area.document.text.strip()
-            logging.info(f"Updating description for category '{self.selected_category}'")
-            for cat in self.all_categories:
-                if cat['name'] == self.selected_category:
-                    cat['description'] = new_description
-                    break
-            self.refresh()
+            cat = self.categories_by_name.get(self.selected_category)
+            text_area = event.text_area
+            # Showing a category's description fires Changed too; there is nothing to save then
+            if cat is None or text_area.document.text.strip() == cat.description:
+                return
+            # Debounce: only the last change within the window is written back
+            if self._desc_timer is not None:
+                self._desc_timer.stop()
+            self._pending_desc = (cat, text_area)
+            self._desc_timer = self.set_timer(DESCRIPTION_COMMIT_DELAY, self._commit_description)
+
+    def _commit_description(self):
+        """Write a pending description edit back to its category record."""
+        if self._desc_timer is not None:
+            self._desc_timer.stop()
+            self._desc_timer = None
+        if self._pending_desc is None:
+            return
+        cat, text_area = self._pending_desc
+        self._pending_desc = None
+        logging.info("Updating description for category '%s'", cat.name)
+        cat.description = text_area.document.text.strip()
 
 class ScaleWidget(Static):
     """Widget for managing scales within a selected category."""
-    def __init__(self, llm_call_manager, all_categories, id=None):
+    def __init__(self, llm_call_manager, all_categories, categories_by_name, id=None):
         super().__init__(id=id)
         self.llm_call_manager = llm_call_manager
         self.all_categories = all_categories  # Reference to the categories data structure
+        self.categories_by_name = categories_by_name  # Name index maintained by CategoryWidget
         self.selected_category = None
         self.current_scales = []
+        self.scales_by_name = {}
+        self._scale_options = []
+        self._scale_option_index = {}
+        self._last_scale_options = None  # Copy of the options last handed to the Select
         self.selected_scale = None
+        self._desc_timer = None
+        self._pending_desc = None  # (scale, text_area) edit waiting for the debounce timer
+        self._retrieve_task = None
         self.scale_components = SelectScaleWidget()
 
     def compose(self) -> ComposeResult:
         yield self.scale_components
 
+    def on_unmount(self) -> None:
+        self._commit_description()
+
     def update_scales(self, selected_category_name):
         """Update scales based on the selected category."""
+        self._commit_description()
         self.selected_category = selected_category_name
-        selected_category_data = next(
-            (cat for cat in self.all_categories if cat['name'] == selected_category_name), None
-        )
-        if selected_category_data:
-            self.current_scales = selected_category_data.get("scale", [])
-            if self.current_scales:
-                # Populate the scale select widget
-                self.scale_components.scale_select.set_options([(scale['name'], scale['name']) for scale in self.current_scales])
-                self.scale_components.scale_select.value = self.current_scales[0]['name']
-                self.scale_components.scale_select.visible = True
-                self.scale_components.scale_input_box.visible = True
-                self.scale_components.scale_description_area.visible = True
-                self.scale_components.create_scales_button.visible = False
-                # Display the first scale's details
-                self.display_scale_details(self.current_scales[0]['name'])
+        selected_category_data = self.categories_by_name.get(selected_category_name)
+        with self.app.batch_update():
+            if selected_category_data:
+                self.current_scales = selected_category_data.scale
+                self._rebuild_scale_index()
+                if self.current_scales:
+                    # Populate the scale select widget
+                    self._set_scale_options()
+                    self.scale_components.scale_select.value = self.current_scales[0].name
+                    self.scale_components.scale_select.visible = True
+                    self.scale_components.scale_input_box.display = True
+                    self.scale_components.scale_description_area.display = True
+                    self.scale_components.create_scales_button.visible = False
+                    # Display the first scale's details
+                    self.display_scale_details(self.current_scales[0].name)
+                else:
+                    # No scales available
+                    self._apply_scale_options([])
+                    self.scale_components.scale_select.visible = False
+                    self.scale_components.scale_input_box.display = False
+                    self.scale_components.scale_description_area.display = False
+                    self.scale_components.create_scales_button.visible = True  # Show the button to create scales
             else:
-                # No scales available
-                self.scale_components.scale_select.set_options([])
+                # Category not found
+                self.current_scales = []
+                self.scales_by_name = {}
+                self._apply_scale_options([])
                 self.scale_components.scale_select.visible = False
-                self.scale_components.scale_input_box.visible = False
-                self.scale_components.scale_description_area.visible = False
-                self.scale_components.create_scales_button.visible = True  # Show the button to create scales
-        else:
-            # Category not found
-            self.current_scales = []
-            self.scale_components.scale_select.set_options([])
-            self.scale_components.scale_select.visible = False
-            self.scale_components.scale_input_box.visible = False
-            self.scale_components.scale_description_area.visible = False
-            self.scale_components.create_scales_button.visible = False
-        self.refresh()
+                self.scale_components.scale_input_box.display = False
+                self.scale_components.scale_description_area.display = False
+                self.scale_components.create_scales_button.visible = False
 
     @on(Button.Pressed, "#create-scales-button")
     async def create_scales_pressed(self, event: Button.Pressed) -> None:
-        logging.info(f"Creating initial scales for category '{self.selected_category}'")
+        logging.info("Creating initial scales for category '%s'", self.selected_category)
         self.scale_components.create_scales_button.visible = False
         self.scale_components.loading_indicator.visible = True
-        self.refresh()
-        asyncio.create_task(self.retrieve_scales())
+        if self._retrieve_task and not self._retrieve_task.done():
+            self._retrieve_task.cancel()
+        self._retrieve_task = asyncio.create_task(self.retrieve_scales(), name="retrieve_scales")
 
     async def retrieve_scales(self):
         """Retrieve scales via LLMCallManager for the selected category."""
@@ -423,45 +580,63 @@ class ScaleWidget(Static):
                 self.llm_call_manager.simulate_scale_retrieval,
                 self.selected_category
             )
-            for cat in self.all_categories:
-                if cat['name'] == self.selected_category:
-                    cat['scale'] = scales
-                    break
-            self.current_scales = scales
-            self.scale_components.scale_select.set_options([(scale['name'], scale['name']) for scale in scales])
-            self.scale_components.scale_select.value = scales[0]['name']
-            self.scale_components.scale_select.visible = True
-            self.scale_components.scale_input_box.visible = True
-            self.scale_components.scale_description_area.visible = True
-            self.scale_components.create_scales_button.visible = False
-            logging.debug(f"Scales retrieved for category '{self.selected_category}': {scales}")
-            self.display_scale_details(scales[0]['name'])
         except Exception as e:
-            logging.error(f"Error retrieving scales for category '{self.selected_category}': {e}")
-        finally:
+            logging.error("Error retrieving scales for category '%s': %s", self.selected_category, e)
+            scales = None
+        # A cancelled retrieval never gets here; the one replacing it owns the loading indicator
+        with self.app.batch_update():
+            if scales:
+                self.current_scales = [Scale.from_dict(scale) for scale in scales]
+                cat = self.categories_by_name.get(self.selected_category)
+                if cat is not None:
+                    cat.scale = self.current_scales
+                self._rebuild_scale_index()
+                self._set_scale_options()
+                self.scale_components.scale_select.value = self.current_scales[0].name
+                self.scale_components.scale_select.visible = True
+                self.scale_components.scale_input_box.display = True
+                self.scale_components.scale_description_area.display = True
+                self.scale_components.create_scales_button.visible = False
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug("Scales retrieved for category '%s': %s", self.selected_category, scales)
+                self.display_scale_details(self.current_scales[0].name)
             self.scale_components.loading_indicator.visible = False
-            self.refresh()
+
+    def _rebuild_scale_index(self):
+        """Index current_scales by name for O(1) lookups."""
+        self.scales_by_name = {scale.name: scale for scale in self.current_scales}
+
+    def _set_scale_options(self):
+        """Build the scale Select options from current_scales and remember each name's position."""
+        self._scale_options = [(scale.name, scale.name) for scale in self.current_scales]
+        self._scale_option_index = {value: i for i, (_, value) in enumerate(self._scale_options)}
+        self._apply_scale_options(self._scale_options)
+
+    def _apply_scale_options(self, options):
+        """Hand options to the scale Select, skipping the rebuild when they are unchanged."""
+        if options == self._last_scale_options:
+            return
+        self._last_scale_options = list(options)
+        self.scale_components.scale_select.set_options(options)
 
     def display_scale_details(self, scale_name):
         """Display details of the selected scale."""
+        self._commit_description()
         self.selected_scale = scale_name
-        selected_scale_data = next(
-            (scale for scale in self.current_scales if scale['name'] == scale_name), None
-        )
+        selected_scale_data = self.scales_by_name.get(scale_name)
         if selected_scale_data:
-            self.scale_components.scale_input_box.value = selected_scale_data['name']
-            self.scale_components.scale_description_area.text = selected_scale_data['description']
-            self.scale_components.scale_input_box.visible = True
-            self.scale_components.scale_description_area.visible = True
+            self.scale_components.scale_input_box.value = selected_scale_data.name
+            self.scale_components.scale_description_area.text = selected_scale_data.description
+            self.scale_components.scale_input_box.display = True
+            self.scale_components.scale_description_area.display = True
         else:
-            self.scale_components.scale_input_box.visible = False
-            self.scale_components.scale_description_area.visible = False
-        self.refresh()
+            self.scale_components.scale_input_box.display = False
+            self.scale_components.scale_description_area.display = False
 
     @on(Select.Changed, "#scale-select")
     async def scale_changed(self, event: Select.Changed) -> None:
         selected_scale = event.value
-        logging.info(f"Scale Select changed: {selected_scale}")
+        logging.info("Scale Select changed: %s", selected_scale)
         if selected_scale == Select.BLANK:
             logging.info("No scale selection made (BLANK)")
             return
@@ -474,35 +649,51 @@ class ScaleWidget(Static):
             if not new_name:
                 logging.warning("Attempted to rename scale to an empty string.")
                 return
-            logging.info(f"Renaming scale '{self.selected_scale}' to '{new_name}' in category '{self.selected_category}'")
-            for scale in self.current_scales:
-                if scale['name'] == self.selected_scale:
-                    scale['name'] = new_name
-                    break
-            for cat in self.all_categories:
-                if cat['name'] == self.selected_category:
-                    cat['scale'] = self.current_scales
-                    break
-            self.scale_components.scale_select.set_options([(scale['name'], scale['name']) for scale in self.current_scales])
+            if new_name == self.selected_scale:
+                return
+            logging.info("Renaming scale '%s' to '%s' in category '%s'", self.selected_scale, new_name, self.selected_category)
+            scale = self.scales_by_name.pop(self.selected_scale, None)
+            if scale is not None:
+                scale.name = new_name
+                self.scales_by_name[new_name] = scale
+            cat = self.categories_by_name.get(self.selected_category)
+            if cat is not None:
+                cat.scale = self.current_scales
+            # Only the renamed entry changes; patch it instead of rebuilding the list
+            index = self._scale_option_index.pop(self.selected_scale, None)
+            if index is not None:
+                self._scale_options[index] = (new_name, new_name)
+                self._scale_option_index[new_name] = index
+            self._apply_scale_options(self._scale_options)
             self.scale_components.scale_select.value = new_name
             self.selected_scale = new_name
-            self.refresh()
 
     @on(TextArea.Changed, "#scale-description-area")
     def scale_description_changed(self, event: TextArea.Changed) -> None:
         if self.selected_scale and self.selected_category:
-            new_description = event.text_area.document.text.strip()
-            logging.info(f"Updating description for scale '{self.selected_scale}' in category '{self.selected_category}'")
-            for scale in self.current_scales:
-                if scale['name'] == self.selected_scale:
-                    scale['description'] = new_description
-                    break
-            for cat in self.all_categories:
-                if cat['name'] == self.selected_category:
-                    cat['scale'] = self.current_scales
-                    break
-            logging.debug(f"Scale '{self.selected_scale}' description updated.")
-            self.refresh()
+            scale = self.scales_by_name.get(self.selected_scale)
+            text_area = event.text_area
+            # Showing a scale's description fires Changed too; there is nothing to save then
+            if scale is None or text_area.document.text.strip() == scale.description:
+                return
+            # Debounce: only the last change within the window is written back
+            if self._desc_timer is not None:
+                self._desc_timer.stop()
+            self._pending_desc = (scale, text_area)
+            self._desc_timer = self.set_timer(DESCRIPTION_COMMIT_DELAY, self._commit_description)
+
+    def _commit_description(self):
+        """Write a pending description edit back to its scale record."""
+        if self._desc_timer is not None:
+            self._desc_timer.stop()
+            self._desc_timer = None
+        if self._pending_desc is None:
+            return
+        scale, text_area = self._pending_desc
+        self._pending_desc = None
+        logging.info("Updating description for scale '%s' in category '%s'", scale.name, self.selected_category)
+        scale.description = text_area.document.text.strip()
+        logging.debug("Scale '%s' description updated.", scale.name)
 
 class CategoryScaleWidget(Static):
     """Widget that combines CategoryWidget and ScaleWidget."""
@@ -511,8 +702,9 @@ class CategoryScaleWidget(Static):
         super().__init__(id=id)
         self.llm_call_manager = llm_call_manager
         self.all_categories = []
-        self.category_widget = CategoryWidget(self.llm_call_manager, self.all_categories, id="category-widget")
-        self.scale_widget = ScaleWidget(self.llm_call_manager, self.all_categories, id="scale-widget")
+        self.categories_by_name = {}
+        self.category_widget = CategoryWidget(self.llm_call_manager, self.all_categories, self.categories_by_name, id="category-widget")
+        self.scale_widget = ScaleWidget(self.llm_call_manager, self.all_categories, self.categories_by_name, id="scale-widget")
 
     def compose(self) -> ComposeResult:
         with Vertical(id="main-container"):
@@ -532,6 +724,20 @@ class MainApp(App):
         self.all_categories = []  # Initialize with an empty data structure
         logging.debug("MainApp initialized")
 
+    def on_mount(self) -> None:
+        """Install one process-wide default executor sized for LLM concurrency."""
+        max_workers = int(os.environ.get("THREAD_POOL_SIZE", "8"))
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        asyncio.get_running_loop().set_default_executor(self.executor)
+        # Safety net in case the app exits without unmounting
+        atexit.register(self.executor.shutdown, wait=False, cancel_futures=True)
+        logging.debug("Default executor set with %s workers", max_workers)
+
+    def on_unmount(self) -> None:
+        """Shut the executor down so pending simulate_* calls do not outlive the app."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        logging.debug("Default executor shut down")
+
     def compose(self) -> ComposeResult:
         yield CategoryScaleWidget(self.llm_call_manager)
      
@@ -54,6 +54,7 @@ class SharedState(SessionDependentUI):
     def __init__(self):
         self._selected_category: Optional[str] = None
         self._categories: List[Dict] = []
+        self._category_index: Dict[str, int] = {}
         self._selected_scale: Optional[str] = None
         self._scales: List[Dict] = []
 
@@ -72,6 +73,20 @@ class SharedState(SessionDependentUI):
     @categories.setter
     def categories(self, value: List[Dict]) -> None:
         self._categories = value
+        self._category_index = {cat['name']: i for i, cat in enumerate(value)}
+
+    def get_category(self, name: Optional[str]) -> Optional[Dict]:
+        """Return the category stored under name, or None."""
+        i = self._category_index.get(name)
+        return self._categories[i] if i is not None else None
+
+    def rename_category(self, old_name: str, new_name: str) -> None:
+        """Rename a category in place and keep the name index in sync."""
+        i = self._category_index.pop(old_name, None)
+        if i is None:
+            return
+        self._categories[i]['name'] = new_name
+        self._category_index[new_name] = i
 
     @property
     def scales(self) -> List[Dict]:
@@ -245,6 +260,9 @@ class CategoryWidget(SessionDependentUI):
         self.llm_call_manager.set_message_post_target(self)
         logging.info(f"Post target message set to: {self.llm_call_manager._message_post_target}")
 
+    def on_unmount(self) -> None:
+        self.llm_call_manager.stop()
+
     def update_select_options(self, options):
         self.category_components.select.set_options(options)
 
@@ -271,7 +289,7 @@ class CategoryWidget(SessionDependentUI):
             return
 
         # Find the selected category data
-        category = next((cat for cat in self.shared_state.categories if cat['name'] == selected_value), None)
+        category = self.shared_state.get_category(selected_value)
 
         if category:
             self.shared_state.selected_category = category['name']
@@ -408,36 +426,48 @@ class SelectCategoryWidget(Static):
         self.shared_state = shared_state
         self.session_manager = session_manager
 
+        # Dispatch tables, built once instead of on every event
+        self._result_handlers = {
+            "category-input": self._handle_title_update,
+            "category-description-area": self._handle_description_update,
+            "refresh-categories": self._handle_categories_update,
+            "retrieve-scales": self._handle_scales_update
+        }
+        self._button_handlers = {
+            "refresh-title-button": self.refresh_title,
+            "refresh-description-button": self.refresh_description,
+            "refresh-both-button": self.refresh_both
+        }
+
     def compose(self) -> ComposeResult:
         """Compose widget layout, yielding each component."""
         yield Label(f"""
                 Assessment Categories for output agent: {self.agent_name}
                 """)
 
-        yield Select(
+        # Keep a reference to each widget as it is composed instead of querying for it later
+        self.select = Select(
             options=[("create_initial", "Create Initial Categories")],
             id="category-select"
         )
-        yield LoadingIndicator()
-        yield Input(placeholder="Rename selected category", id="category-input")
-        yield BoundTextArea("", id="category-description-area")
+        yield self.select
+        self.loading_indicator = LoadingIndicator()
+        yield self.loading_indicator
+        self.input_box = Input(placeholder="Rename selected category", id="category-input")
+        yield self.input_box
+        self.description_area = BoundTextArea("", id="category-description-area")
+        yield self.description_area
         with Grid(id="grid-buttons", classes="grid-buttons"):
-            yield Button("Refresh Title", id="refresh-title-button", classes="action-button")
-            yield Button("Refresh Description", id="refresh-description-button", classes="action-button")
-        yield Label("Modify Directly or use buttons for agent assistance", id="lbl_text")
+            self.refresh_title_button = Button("Refresh Title", id="refresh-title-button", classes="action-button")
+            yield self.refresh_title_button
+            self.refresh_description_button = Button("Refresh Description", id="refresh-description-button", classes="action-button")
+            yield self.refresh_description_button
+        self.lbl_text = Label("Modify Directly or use buttons for agent assistance", id="lbl_text")
+        yield self.lbl_text
 
     def on_mount(self) -> None:
 
         """Initialize states and hide elements after widgets are mounted."""
-        self.select = self.query_one("#category-select", Select)
-        self.loading_indicator = self.query_one("#loading-indicator", Static)
-        self.input_box = self.query_one("#category-input", Input)
-        self.description_area = self.query_one("#category-description-area", BoundTextArea)
-        self.refresh_title_button = self.query_one("#refresh-title-button", Button)
-        self.refresh_description_button = self.query_one("#refresh-description-button", Button)
-        # self.refresh_both_button = self.query_one("#refresh-both-button", Button)
-        self.lbl_text = self.query_one("#lbl_text", Label)
-
         # Initial visibility setup
         self.loading_indicator.visible = False
         self.input_box.visible = False
@@ -452,6 +482,9 @@ class SelectCategoryWidget(Static):
         self.llm_call_manager.set_message_post_target(self)
         logging.info(f"Post target message set to: {self.llm_call_manager._message_post_target}")
 
+    def on_unmount(self) -> None:
+        self.llm_call_manager.stop()
+
     def update_category_details(self, title: str, description: str) -> None:
         """Update both title and description for the selected category."""
         self.title_value = title
@@ -483,10 +516,8 @@ class SelectCategoryWidget(Static):
         
         # Disable UI components and show loading indicator
         # self._disable_ui()
-        button = self.query_one("#refresh-title-button")
-        if isinstance(button, Button):
-            button.disabled = True
-        self.query_one(LoadingIndicator).show(f"Fetching new category name for {self.shared_state.selected_category}. ")
+        self.refresh_title_button.disabled = True
+        self.loading_indicator.show(f"Fetching new category name for {self.shared_state.selected_category}. ")
 
         try:
             config = self._llm_config_current_agent()
@@ -516,11 +547,9 @@ class SelectCategoryWidget(Static):
 
         # Disable UI components and show loading indicator
         # self._disable_ui()
-        button = self.query_one("#refresh-description-button")
-        if isinstance(button, Button):
-            button.disabled = True
+        self.refresh_description_button.disabled = True
 
-        self.query_one(LoadingIndicator).show(f"Fetching new description for category: {self.shared_state.selected_category}. ")
+        self.loading_indicator.show(f"Fetching new description for category: {self.shared_state.selected_category}. ")
 
         try:
             config = self._llm_config_current_agent()
@@ -569,10 +598,7 @@ class SelectCategoryWidget(Static):
             logging.info(f"Category '{event.value}' selected.")
 
             # Fetch category details from shared state storage
-            category_data = next(
-                (cat for cat in self.shared_state.categories if cat['name'] == event.value), 
-                None
-            )
+            category_data = self.shared_state.get_category(event.value)
 
             # Populate the input box and description area with stored values
             if category_data:
@@ -625,14 +651,7 @@ class SelectCategoryWidget(Static):
     @on(LLMCallComplete)
     async def handle_llm_call_complete(self, event: LLMCallComplete) -> None:
         """Handle LLM call completions."""
-        handlers = {
-            "category-input": self._handle_title_update,
-            "category-description-area": self._handle_description_update,
-            "refresh-categories": self._handle_categories_update,
-            "retrieve-scales": self._handle_scales_update
-        }
-        
-        handler = handlers.get(event.input_id)
+        handler = self._result_handlers.get(event.input_id)
         if handler:
             try:
                 await handler(event.result)
@@ -643,17 +662,11 @@ class SelectCategoryWidget(Static):
         # Re-enable UI components and hide loading indicator
         # self._enable_ui()
 
-        button = self.query_one("#refresh-description-button")
-        if isinstance(button, Button):
-            button.disabled = False
-            button.refresh()
+        self.refresh_description_button.disabled = False
 
-        button = self.query_one("#refresh-title-button")
-        if isinstance(button, Button):
-            button.disabled = False
-            button.refresh()
+        self.refresh_title_button.disabled = False
 
-        self.query_one(LoadingIndicator).hide()                
+        self.loading_indicator.hide()                
 
     @on(LLMCallError)
     async def handle_llm_call_error(self, event: LLMCallError) -> None:
@@ -664,18 +677,12 @@ class SelectCategoryWidget(Static):
 
         # Re-enable UI components and hide loading indicator
         self._enable_ui()
-        self.query_one(LoadingIndicator).hide()
+        self.loading_indicator.hide()
 
     @on(Button.Pressed)
     async def handle_button_press(self, event: Button.Pressed) -> None:
         """Handle button press events."""
-        handlers = {
-            "refresh-title-button": self.refresh_title,
-            "refresh-description-button": self.refresh_description,
-            "refresh-both-button": self.refresh_both
-        }
-        
-        handler = handlers.get(event.button.id)
+        handler = self._button_handlers.get(event.button.id)
         if handler:
             await handler()
 
@@ -684,10 +691,7 @@ class SelectCategoryWidget(Static):
         """Handle title input changes, update shared state, save to storage, and refresh select box."""
         if self.shared_state.selected_category:
             # Update the category name in the shared state
-            for category in self.shared_state.categories:
-                if category['name'] == self.shared_state.selected_category:
-                    category['name'] = event.value
-                    break
+            self.shared_state.rename_category(self.shared_state.selected_category, event.value)
 
             # Update the input field with the new value
             self.title_value = event.value
@@ -700,7 +704,7 @@ class SelectCategoryWidget(Static):
             self._refresh_select_box()
 
             # Update the selected category to the new name
-            select_widget = self.app.query_one("#category-select")
+            select_widget = self.select
             # Ensure the updated name is in the options before setting it as selected
             if event.value in [option[0] for option in select_widget._options]:
                 select_widget.value = event.value
@@ -709,7 +713,7 @@ class SelectCategoryWidget(Static):
 
     def _refresh_select_box(self) -> None:
         """Refresh the select box with updated categories from shared state."""
-        select_widget = self.app.query_one("#category-select")
+        select_widget = self.select
         
         # Populate the select box with updated category names
         options = [(cat['name'], cat['name']) for cat in self.shared_state.categories]
@@ -720,10 +724,9 @@ class SelectCategoryWidget(Static):
         """Handle category description changes, update shared state, and save to storage."""
         if self.shared_state.selected_category:
             # Directly update the description of the selected category in the shared state
-            for category in self.shared_state.categories:
-                if category['name'] == self.shared_state.selected_category:
-                    category['description'] = event.text
-                    break
+            category = self.shared_state.get_category(self.shared_state.selected_category)
+            if category:
+                category['description'] = event.text
 
             # Persist the updated shared state to storage
             category_widget = self.app.query_one(CategoryScaleWidget)
@@ -752,10 +755,7 @@ class SelectCategoryWidget(Static):
         """Handle title update from LLM result, update shared state, save to storage, and refresh the select box."""
         if self.shared_state.selected_category:
             # Update the shared state with the new title from LLM result
-            for category in self.shared_state.categories:
-                if category['name'] == self.shared_state.selected_category:
-                    category['name'] = result
-                    break
+            self.shared_state.rename_category(self.shared_state.selected_category, result)
 
             # Update the title value in the input field
             self.title_value = result
@@ -768,7 +768,7 @@ class SelectCategoryWidget(Static):
             self._refresh_select_box()
 
             # Update the select box to reflect the new title
-            select_widget = self.app.query_one("#category-select")
+            select_widget = self.select
             if result in [option[0] for option in select_widget._options]:
                 select_widget.value = result
                 
@@ -776,14 +776,12 @@ class SelectCategoryWidget(Static):
         """Handle description update from LLM result, update shared state, and save to storage."""
         if self.shared_state.selected_category:
             # Update the shared state with the new description from LLM result
-            for category in self.shared_state.categories:
-                if category['name'] == self.shared_state.selected_category:
-                    category['description'] = result
-                    break
+            category = self.shared_state.get_category(self.shared_state.selected_category)
+            if category:
+                category['description'] = result
 
             # Update the description value in the text area
-            description_area = self.app.query_one("#category-description-area")
-            description_area.load_text(result) 
+            self.description_area.load_text(result)
 
             # Access the CategoryScaleWidget and persist changes
             category_widget = self.app.query_one(CategoryScaleWidget)
@@ -834,6 +832,9 @@ class ScaleWidget(SessionDependentUI):
         # Initial UI state setup
         self._clear_scales()
 
+    def on_unmount(self) -> None:
+        self.llm_call_manager.stop()
+
     def handle_category_selected(self, category_name) -> None:
         """Handle category selection to display scales."""
         selected_category = category_name
@@ -844,10 +845,7 @@ class ScaleWidget(SessionDependentUI):
 
         if selected_category:
             # Retrieve scales from shared state
-            category_data = next(
-                (cat for cat in self.shared_state.categories if cat['name'] == selected_category),
-                None
-            )
+            category_data = self.shared_state.get_category(selected_category)
 
             if category_data and category_data.get('scales'):
                 self.scales = category_data['scales']
@@ -902,10 +900,9 @@ class ScaleWidget(SessionDependentUI):
         """Update the shared state and UI with the retrieved scales."""
         if self.shared_state.selected_category:
             # Update the shared state
-            for category in self.shared_state.categories:
-                if category['name'] == self.shared_state.selected_category:
-                    category['scales'] = scales
-                    break
+            category = self.shared_state.get_category(self.shared_state.selected_category)
+            if category:
+                category['scales'] = scales
             self.scales = scales
 
             # Update UI
@@ -1001,10 +998,7 @@ class SelectScaleWidget(Static):
             self.shared_state.selected_scale = event.value
             
             # Find the selected category first
-            category = next(
-                (cat for cat in self.shared_state.categories if cat['name'] == self.shared_state.selected_category),
-                None
-            )
+            category = self.shared_state.get_category(self.shared_state.selected_category)
 
             # Now, find the scale within the selected category
             scale_data = next(
@@ -1026,15 +1020,14 @@ class SelectScaleWidget(Static):
         """Handle changes to the scale's name."""
         if self.shared_state.selected_category and self.shared_state.selected_scale:
             # Update the scale name in the shared state
-            for category in self.shared_state.categories:
-                if category['name'] == self.shared_state.selected_category:
-                    for scale in category.get('scales', []):
-                        if scale['name'] == self.shared_state.selected_scale:
-                            # Update the scale name
-                            scale['name'] = event.value
-                            # Update the selected scale name
-                            self.shared_state.selected_scale = event.value
-                            break
+            category = self.shared_state.get_category(self.shared_state.selected_category) or {}
+            for scale in category.get('scales', []):
+                if scale['name'] == self.shared_state.selected_scale:
+                    # Update the scale name
+                    scale['name'] = event.value
+                    # Update the selected scale name
+                    self.shared_state.selected_scale = event.value
+                    break
 
             # Update storage
             category_scale_widget = self.app.query_one(CategoryScaleWidget)
@@ -1047,10 +1040,7 @@ class SelectScaleWidget(Static):
         """Refresh the scale select box with updated scale names."""
         scale_options = [
             (scale['name'], scale['name'])
-            for scale in next(
-                (cat for cat in self.shared_state.categories if cat['name'] == self.shared_state.selected_category),
-                {}
-            ).get('scales', [])
+            for scale in (self.shared_state.get_category(self.shared_state.selected_category) or {}).get('scales', [])
         ]
 
         # Refresh the select box with updated options
@@ -1064,12 +1054,11 @@ class SelectScaleWidget(Static):
     def handle_scale_description_changed(self, event: TextSubmitted) -> None:
         """Handle changes to the scale's description."""
         if self.shared_state.selected_category and self.shared_state.selected_scale:
-            for category in self.shared_state.categories:
-                if category['name'] == self.shared_state.selected_category:
-                    for scale in category.get('scales', []):
-                        if scale['name'] == self.shared_state.selected_scale:
-                            scale['description'] = event.text
-                            break
+            category = self.shared_state.get_category(self.shared_state.selected_category) or {}
+            for scale in category.get('scales', []):
+                if scale['name'] == self.shared_state.selected_scale:
+                    scale['description'] = event.text
+                    break
 
             # Update storage
             category_scale_widget = self.app.query_one(CategoryScaleWidget)
@@ -11,7 +11,6 @@ from textual.widgets import Label, Header, Select, Input, Static, TextArea, Butt
 from textual.message import Message
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 
 from textual.containers import Vertical, Horizontal
 from textual.widgets import Label, Header, Select, Input, Static, TextArea, Button
@@ -56,7 +55,6 @@ class CategoryScaleWidget(SessionDependentUI):
         self.session_manager = session_manager
         self.screen_name = screen_name
         self._init_widgets()
-        self.executor = ThreadPoolExecutor(max_workers=5)  # For synchronous storage methods
 
     def _init_widgets(self) -> None:
         """Initialize child widgets with shared data reference."""
@@ -100,9 +98,9 @@ class CategoryScaleWidget(SessionDependentUI):
 
     async def get_or_initialize_category_data_async(self, agent_name: str) -> dict:
         """Asynchronous method to retrieve or initialize category data for an agent."""
-        # Run synchronous get_data in executor
-        all_agents_data = await asyncio.get_event_loop().run_in_executor(
-            self.executor,
+        # Run synchronous get_data in the shared executor
+        all_agents_data = await asyncio.get_running_loop().run_in_executor(
+            None,  # The app's shared default executor
             self.session_manager.get_data,
             "agents",
             self.screen_name
@@ -123,9 +121,9 @@ class CategoryScaleWidget(SessionDependentUI):
         else:
             all_agents_data = {agent_name: new_agent_data}
 
-        # Run synchronous update_data in executor
-        await asyncio.get_event_loop().run_in_executor(
-            self.executor,
+        # Run synchronous update_data in the shared executor
+        await asyncio.get_running_loop().run_in_executor(
+            None,  # The app's shared default executor
             self.session_manager.update_data,
             "agents",
             all_agents_data,
@@ -136,9 +134,9 @@ class CategoryScaleWidget(SessionDependentUI):
 
     async def update_storage_async(self, categories: List[Dict]) -> None:
         """Asynchronously update the storage with the new categories."""
-        # Run synchronous get_data in executor
-        all_agents_data = await asyncio.get_event_loop().run_in_executor(
-            self.executor,
+        # Run synchronous get_data in the shared executor
+        all_agents_data = await asyncio.get_running_loop().run_in_executor(
+            None,  # The app's shared default executor
             self.session_manager.get_data,
             "agents",
             self.screen_name
@@ -157,9 +155,9 @@ class CategoryScaleWidget(SessionDependentUI):
                 "base_agent": self.agent_name
             }
         
-        # Run synchronous update_data in executor
-        await asyncio.get_event_loop().run_in_executor(
-            self.executor,
+        # Run synchronous update_data in the shared executor
+        await asyncio.get_running_loop().run_in_executor(
+            None,  # The app's shared default executor
             self.session_manager.update_data,
             "agents",
             all_agents_data,
@@ -202,6 +200,10 @@ class CategoryWidget(SessionDependentUI):
         self.llm_call_manager.set_message_post_target(self)
         logging.info(f"Post target message set to: {self.llm_call_manager._message_post_target}")
 
+    def on_unmount(self) -> None:
+        """Stop the LLM manager's workers."""
+        self.llm_call_manager.stop()
+
     def update_select_options(self, options: List[Tuple[str, str]]) -> None:
         """Update the select widget options."""
         self.category_components.select.set_options(options)
@@ -436,7 +438,12 @@ class ScaleWidget(SessionDependentUI):
         self.llm_call_manager.set_message_post_target(self)
         logging.info(f"Post target message set to: {self.llm_call_manager._message_post_target}")
 
+    def on_unmount(self) -> None:
+        """Stop the LLM manager's workers."""
+        self.llm_call_manager.stop()
+
     # Reactive Watchers
+
     def watch_selected_category(
         self,
         old_value: Optional[str],
@@ -733,6 +740,10 @@ class SelectCategoryWidget(Static):
         self.llm_call_manager = LLMCallManager()
         self.llm_call_manager.set_message_post_target(self)
         logging.info(f"Post target message set to: {self.llm_call_manager._message_post_target}")
+
+    def on_unmount(self) -> None:
+        """Stop the LLM manager's workers."""
+        self.llm_call_manager.stop()
     
     def compose(self) -> ComposeResult:
         """Compose the widget layout."""
@@ -1077,7 +1088,12 @@ class ScaleWidget(SessionDependentUI):
         self.llm_call_manager.set_message_post_target(self)
         logging.info(f"Post target message set to: {self.llm_call_manager._message_post_target}")
 
+    def on_unmount(self) -> None:
+        """Stop the LLM manager's workers."""
+        self.llm_call_manager.stop()
+
     # Reactive Watchers
+
     def watch_selected_category(
         self,
         old_value: Optional[str],
@@ -1367,6 +1383,10 @@ class SelectScaleWidget(Static):
         self.llm_call_manager = LLMCallManager()
         self.llm_call_manager.set_message_post_target(self)
         logging.info(f"Post target message set to: {self.llm_call_manager._message_post_target}")
+
+    def on_unmount(self) -> None:
+        """Stop the LLM manager's workers."""
+        self.llm_call_manager.stop()
     
     def compose(self) -> ComposeResult:
         """Compose the widget layout."""
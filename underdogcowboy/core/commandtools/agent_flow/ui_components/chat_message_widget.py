@@ -3,7 +3,7 @@ import logging
 from textual.widget import Widget
 from textual.app import ComposeResult
 from textual.widgets import Static, Button
-from textual.containers import Vertical, Horizontal
+from textual.containers import Horizontal
 from rich.markdown import Markdown
 
 class ChatMessageWidget(Widget):
@@ -14,12 +14,12 @@ class ChatMessageWidget(Widget):
         self.text = text  # Message text
 
     def compose(self) -> ComposeResult:
-        with Vertical():
-            yield Static(Markdown(f"#### {self.role}:\n{self.text}"), classes="message-text")
-            with Horizontal(classes="message-buttons"):
-                yield Button("Copy", id=f"copy-{self.message_id}", classes="message-button")
-                yield Button("Export", id=f"export-{self.message_id}", classes="message-button")
-                # Add more buttons as needed
+        # The widget itself lays its children out vertically; no extra container per message
+        yield Static(Markdown(f"#### {self.role}:\n{self.text}"), classes="message-text")
+        with Horizontal(classes="message-buttons"):
+            yield Button("Copy", id=f"copy-{self.message_id}", classes="message-button")
+            yield Button("Export", id=f"export-{self.message_id}", classes="message-button")
+            # Add more buttons as needed
 
     def on_button_pressed(self, event: Button.Pressed):
         button_id = event.button.id
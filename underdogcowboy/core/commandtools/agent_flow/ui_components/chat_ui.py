@@ -112,6 +112,9 @@ class ChatUI(Static):
     def on_mount(self) -> None:
         self.render_chat()
 
+    def on_unmount(self) -> None:
+        self.llm_call_manager.stop()
+
     def _get_model_and_timeline(self) -> Tuple[ConfigurableModel, Timeline]:
         self.model_id = self.app.get_current_llm_config()["model_id"]
         self.provider = self.app.get_current_llm_config()["provider"]
@@ -62,6 +62,9 @@ class ChatUI(Static):
         self.llm_call_manager = LLMCallManager()
         self.llm_call_manager.set_message_post_target(self)
 
+    def on_unmount(self) -> None:
+        self.llm_call_manager.stop()
+
     def compose(self) -> ComposeResult:
         with VerticalScroll(id="chat-scroll", disabled=False):
             yield Vertical(id="chat-messages")
@@ -1,7 +1,6 @@
 import logging
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 
 from textual.widgets import Static, Button, LoadingIndicator
 from textual.app import ComposeResult
@@ -70,11 +69,8 @@ class AnalyzeUI(SessionDependentUI):
             if not current_agent:
                 raise SessionNotLoadedError("No agent currently loaded. Please load an agent first.")
 
-            # Run the analysis in a separate thread pool
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                result = await asyncio.get_event_loop().run_in_executor(
-                    executor, run_analysis, llm_config, current_agent
-                )
+            # Run the analysis on the app's shared thread pool
+            result = await asyncio.to_thread(run_analysis, llm_config, current_agent)
 
             if result.startswith("Error:"):
                 raise AnalysisError(result)
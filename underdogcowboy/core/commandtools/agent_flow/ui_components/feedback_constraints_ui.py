@@ -1,5 +1,3 @@
-from concurrent.futures import ThreadPoolExecutor
-import asyncio
 import logging
 
 from textual import on
@@ -31,32 +29,43 @@ class FeedbackConstraintsUI(SessionDependentUI):
 
 
     def compose(self) -> ComposeResult:
-        yield Label("Feedback on Operational Constraints:", id="feedback-constraints-label", classes="hidden")
-        yield Static(id="feedback-constraints-result", classes="feedback-result hidden")
-        yield Button("Start Feedback", id="start-feedback-constraints-button", classes="hidden")
-        yield Button("Re-run Feedback", id="rerun-feedback-constraints-button", classes="hidden")
-        yield LoadingIndicator(id="loading-feedback-constraints", classes="hidden")
+        # Keep references so the handlers below don't walk the DOM on every click
+        self.feedback_label = Label("Feedback on Operational Constraints:", id="feedback-constraints-label", classes="hidden")
+        self.feedback_result = Static(id="feedback-constraints-result", classes="feedback-result hidden")
+        self.start_button = Button("Start Feedback", id="start-feedback-constraints-button", classes="hidden")
+        self.rerun_button = Button("Re-run Feedback", id="rerun-feedback-constraints-button", classes="hidden")
+        self.loading_indicator = LoadingIndicator(id="loading-feedback-constraints", classes="hidden")
+        yield self.feedback_label
+        yield self.feedback_result
+        yield self.start_button
+        yield self.rerun_button
+        yield self.loading_indicator
     
     def on_mount(self) -> None:
         self.check_existing_feedback()
+
+    def on_unmount(self) -> None:
+        self.llm_call_manager.stop()
     
     def check_existing_feedback(self) -> None:
         existing_feedback = self.session_manager.get_data("last_feedback_constraints")
         if existing_feedback:
             self.show_feedback(existing_feedback)
-            self.query_one("#rerun-feedback-constraints-button").remove_class("hidden")
+            self.rerun_button.remove_class("hidden")
         else:
-            self.query_one("#start-feedback-constraints-button").remove_class("hidden")
+            self.start_button.remove_class("hidden")
     
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id in ["start-feedback-constraints-button", "rerun-feedback-constraints-button"]:
-            self.run_feedback()
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button is self.start_button or event.button is self.rerun_button:
+            await self.run_feedback()
     
-    def run_feedback(self) -> None:
-        self.query_one("#start-feedback-constraints-button").add_class("hidden")
-        self.query_one("#rerun-feedback-constraints-button").add_class("hidden")
-        self.query_one("#feedback-constraints-result").add_class("hidden")
-        self.query_one("#loading-feedback-constraints").remove_class("hidden")
+    async def run_feedback(self) -> None:
+        # Swap the buttons for the loading indicator in a single repaint
+        with self.app.batch_update():
+            self.start_button.add_class("hidden")
+            self.rerun_button.add_class("hidden")
+            self.feedback_result.add_class("hidden")
+            self.loading_indicator.remove_class("hidden")
 
         llm_config = self.app.get_current_llm_config()
         if not llm_config:
@@ -73,7 +82,8 @@ class FeedbackConstraintsUI(SessionDependentUI):
         pre_prompt = "Provide feedback on how the following agent understands the constraints it has to operate within."
        
         session_name = str(self.session_manager.current_session_name)
-        asyncio.create_task(self.llm_call_manager.submit_llm_call_with_agent( 
+        # Submitting only enqueues the call, so await it here rather than wrapping it in a task
+        await self.llm_call_manager.submit_llm_call_with_agent( 
             
             llm_function = send_agent_data_to_llm,
             llm_config = llm_config,
@@ -84,33 +94,32 @@ class FeedbackConstraintsUI(SessionDependentUI):
             pre_prompt = pre_prompt,    
             post_prompt = None
              
-         ))
+         )
 
     @on(LLMCallComplete)
     async def on_feedback_input_complete(self, event: LLMCallComplete) -> None:
         if event.input_id == "feedback-constraints":
             self.update_and_show_feedback(event.result)
-            self.query_one("#loading-feedback-constraints").add_class("hidden")
 
     @on(LLMCallError)
     async def on_feedback_input_error(self, event: LLMCallError) -> None:
         if event.input_id == "feedback-input":    
             self.show_error(event.error)
-            self.query_one("#loading-feedback-constraints").add_class("hidden")
 
     def update_and_show_feedback(self, result: str) -> None:
         self.session_manager.update_data("last_feedback_constraints", result, screen_name=self.screen_name)
         self.show_feedback(result)
 
     def show_feedback(self, result: str) -> None:
-        self.query_one("#loading-feedback-constraints").add_class("hidden")
-        self.query_one("#feedback-constraints-label").remove_class("hidden")
-        feedback_widget = self.query_one("#feedback-constraints-result")
-        feedback_widget.update(result)
-        feedback_widget.remove_class("hidden")
-        self.query_one("#rerun-feedback-constraints-button").remove_class("hidden")
+        with self.app.batch_update():
+            self.loading_indicator.add_class("hidden")
+            self.feedback_label.remove_class("hidden")
+            self.feedback_result.update(result)
+            self.feedback_result.remove_class("hidden")
+            self.rerun_button.remove_class("hidden")
 
     def show_error(self, error_message: str) -> None:
-        self.query_one("#loading-feedback-constraints").add_class("hidden")
-        self.query_one("#start-feedback-constraints-button").remove_class("hidden")
+        with self.app.batch_update():
+            self.loading_indicator.add_class("hidden")
+            self.start_button.remove_class("hidden")
         self.app.notify(f"Error: {error_message}", severity="error")
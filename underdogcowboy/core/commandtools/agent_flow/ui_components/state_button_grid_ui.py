@@ -67,6 +67,8 @@ class StateButtonGrid(Static):
         self.state_machine = state_machine
         self.all_actions = self.get_ordered_actions()
         self.state_machine_active_on_mount = state_machine_active_on_mount
+        self._action_by_button_id = {}  # Filled in compose, so handlers never parse button labels
+        self._buttons: List[Button] = []  # The grid's buttons, so updates don't walk the DOM
 
     def get_ordered_actions(self) -> List[str]:
         all_actions = set()
@@ -102,9 +104,14 @@ class StateButtonGrid(Static):
         return ordered_actions
 
     def compose(self) -> ComposeResult:
+        self._buttons = []
         with Grid(id="button-grid"):
             for action in self.all_actions:
-                yield Button(str(action), id=f"btn-{action}", classes="action-button")
+                button_id = f"btn-{action}"
+                button = Button(str(action), id=button_id, classes="action-button")
+                self._action_by_button_id[button_id] = action
+                self._buttons.append(button)
+                yield button
 
     def on_mount(self) -> None:
         """Disable or update buttons based on state_machine_active_on_mount flag."""
@@ -113,7 +120,7 @@ class StateButtonGrid(Static):
     def disable_buttons_initially(self) -> None:
         """Disable all buttons initially unless the state machine is active."""
         if not self.state_machine_active_on_mount:
-            for button in self.query("Button"):
+            for button in self._buttons:
                 button.disabled = True
         else:
             self.update_buttons() 
@@ -125,7 +132,7 @@ class StateButtonGrid(Static):
         Args:
             event (Button.Pressed): The button press event.
         """
-        action = str(event.button.label)
+        action = self._action_by_button_id[event.button.id]
 
         # Post the action message to notify other parts of the system
         self.post_message(ActionSelected(action))
@@ -180,8 +187,8 @@ class StateButtonGrid(Static):
     def update_buttons(self) -> None:
         """Update the buttons based on allowed actions from the state machine."""
         allowed_actions = self.state_machine.get_available_commands()
-        for button in self.query("Button"):
-            action = str(button.label)
+        for button in self._buttons:
+            action = self._action_by_button_id[button.id]
             button.disabled = action not in allowed_actions
 
     @on(SessionStateChanged)
@@ -192,5 +199,5 @@ class StateButtonGrid(Static):
             self.update_buttons()
         else:
             # No active session, disable all buttons
-            for button in self.query("Button"):
+            for button in self._buttons:
                 button.disabled = True
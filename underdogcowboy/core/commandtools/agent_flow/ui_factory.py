@@ -20,9 +20,11 @@ class UIFactory:
         elif id == "new-agent-button":
             from ui_components.new_agent_ui import NewAgentUI
             ui_class = NewAgentUI
+            action_func = None
         elif id == "new-dialog_button":
             from ui_components.new_dialog_ui import NewDialogUI
             ui_class = NewDialogUI
+            action_func = None
         elif id == "new-button":
             # Delay import for the new session UI
             from ui_components.new_session_ui import NewSessionUI
@@ -47,7 +49,7 @@ class UIFactory:
         else:
             raise ValueError(f"Unknown  ID: {id}. Make sure the ID is mapped in 'get_ui_and_action'.")
 
-        logging.info(f"Resolving UI class: {ui_class.__name__ if ui_class else None}, Action function: {action_func.__name__ if action_func else None}")
+        logging.debug(f"Resolving UI class: {ui_class.__name__ if ui_class else None}, Action function: {action_func.__name__ if action_func else None}")
 
         if not action_func and not ui_class:
             raise ValueError(f"No UI or action found for  ID: {id}")